@@ -4,14 +4,40 @@ Mammoth Analytics Python SDK
 A Python client for the Mammoth Analytics platform API.
 """
 
-from .client import MammothClient
+from importlib import import_module
+from typing import Any, List
+
 from .exceptions import MammothError, MammothAPIError, MammothAuthError
-from .models import *
 
 __version__ = "0.1.0"
 __all__ = [
     "MammothClient",
-    "MammothError", 
+    "MammothError",
     "MammothAPIError",
     "MammothAuthError",
 ]
+
+
+_SUBMODULES = frozenset({"api", "client", "exceptions", "models", "utils"})
+
+
+def __getattr__(name: str) -> Any:
+    # The client and the pydantic models dominate import time, so they are
+    # only imported on first access (PEP 562). Resolved names are stored in
+    # the module namespace, so this runs once per name.
+    if name in _SUBMODULES:
+        value = import_module(f".{name}", __name__)
+    elif name == "MammothClient":
+        value = import_module(".client", __name__).MammothClient
+    else:
+        models = import_module(".models", __name__)
+        if name not in models.__all__:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = getattr(models, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    models = import_module(".models", __name__)
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES | set(models.__all__))
@@ -4,7 +4,8 @@ API modules for the Mammoth Analytics SDK.
 
 from .files import FilesAPI
 from .jobs import JobsAPI
-from .exports import ExportsAPI
+from .jobs_async import AsyncJobsAPI
+from .exports import ExportsAPI, DataviewExportsAPI
 
-__all__ = ["FilesAPI", "JobsAPI", "ExportsAPI"]
+__all__ = ["FilesAPI", "JobsAPI", "AsyncJobsAPI", "ExportsAPI", "DataviewExportsAPI"]
 
@@ -0,0 +1,113 @@
+"""
+In-memory response cache for idempotent Mammoth API reads.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+CacheKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
+
+
+def _collection_path(endpoint: str) -> str:
+    """Return the collection an endpoint belongs to, e.g. /files/12 -> /files."""
+    head, _, tail = endpoint.rstrip('/').rpartition('/')
+    return head if tail.isdigit() else endpoint.rstrip('/')
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache with a per-entry time-to-live.
+
+    Entries are keyed on the request endpoint and its query parameters and
+    hold the parsed JSON body of a successful GET. When the response carried
+    an ETag or Last-Modified header, the entry is kept after it expires so the
+    next read can be revalidated with a conditional request.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any, Dict[str, str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> CacheKey:
+        """Build a hashable cache key from an endpoint and its query parameters."""
+        return ('/' + endpoint.lstrip('/'), tuple(sorted((params or {}).items())))
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Return the cached body for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, body, validators = entry
+            if expires_at <= time.monotonic():
+                if not validators:
+                    del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return body
+
+    def get_stale(self, key: CacheKey) -> Optional[Tuple[Any, Dict[str, str]]]:
+        """Return the body and validators of an entry that can be revalidated."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry[2]:
+                return None
+            return entry[1], entry[2]
+
+    def set(
+        self,
+        key: CacheKey,
+        body: Any,
+        validators: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Store a response body, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key from make_key()
+            body: Parsed response body
+            validators: ETag and Last-Modified response headers, if any
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, body, validators or {})
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate_resource(self, endpoint: str) -> None:
+        """Drop every entry under the collection that endpoint writes to."""
+        collection = _collection_path('/' + endpoint.lstrip('/'))
+        with self._lock:
+            stale = [
+                key for key in self._entries
+                if key[0] == collection or key[0].startswith(collection + '/')
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def invalidate(self, prefix: Optional[str] = None) -> None:
+        """
+        Drop cached entries whose endpoint starts with prefix.
+
+        Args:
+            prefix: Endpoint prefix such as "/workspaces/1/projects/2/files";
+                every entry is dropped when None
+        """
+        if prefix is None:
+            self.clear()
+            return
+        prefix = '/' + prefix.lstrip('/')
+        with self._lock:
+            stale = [key for key in self._entries if key[0].startswith(prefix)]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
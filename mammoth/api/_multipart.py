@@ -0,0 +1,137 @@
+"""
+Streaming multipart/form-data bodies for file uploads.
+"""
+
+import io
+import os
+import stat
+import uuid
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
+
+from urllib3.fields import RequestField
+
+# (form field name, filename, file object, content type)
+FilePart = Tuple[str, str, BinaryIO, str]
+
+# Size of the blocks handed to the socket while streaming a body
+_BLOCK_SIZE = 256 * 1024
+
+
+def _remaining_size(file_obj: BinaryIO) -> Optional[int]:
+    """Return the number of bytes left in file_obj, or None if it can't be known."""
+    try:
+        position = file_obj.tell()
+        try:
+            st = os.fstat(file_obj.fileno())
+            size = st.st_size if stat.S_ISREG(st.st_mode) else None
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            size = None
+        if size is None:
+            size = file_obj.seek(0, os.SEEK_END)
+            file_obj.seek(position)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+    return max(size - position, 0)
+
+
+class MultipartStream:
+    """
+    Iterable multipart/form-data body that reads file contents on demand.
+
+    requests sends a sized iterable with a Content-Length header and urllib3
+    writes each yielded block straight to the socket, so an upload holds one
+    256 KiB block in memory instead of the fully encoded body. The class has
+    no public read(): given a file-like body, urllib3 and http.client would
+    pull it through in their own 8-16 KiB reads. seek(0) rewinds every part
+    so a failed request can be retried with the same body.
+    """
+
+    def __init__(self, parts: List[FilePart]):
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+
+        self._segments: List[Union[bytes, Tuple[BinaryIO, int, int]]] = []
+        for field_name, filename, file_obj, content_type in parts:
+            field = RequestField(name=field_name, data=b"", filename=filename)
+            field.make_multipart(content_type=content_type)
+            self._segments.append(
+                f"--{self.boundary}\r\n".encode() + field.render_headers().encode()
+            )
+            # Text streams yield str and count characters, not bytes
+            if isinstance(file_obj, io.TextIOBase):
+                raise ValueError(f"Cannot stream text-mode file {filename!r}")
+            size = _remaining_size(file_obj)
+            if size is None:
+                raise ValueError(f"Cannot determine the size of {filename!r}")
+            self._segments.append((file_obj, file_obj.tell(), size))
+            self._segments.append(b"\r\n")
+        self._segments.append(f"--{self.boundary}--\r\n".encode())
+
+        self.len = sum(
+            len(segment) if isinstance(segment, bytes) else segment[2]
+            for segment in self._segments
+        )
+        self.seek(0)
+
+    @classmethod
+    def from_parts(cls, parts: List[FilePart]) -> Optional["MultipartStream"]:
+        """
+        Build a stream, or return None if a part can't be streamed: its size
+        can't be determined or it is a text-mode file.
+        """
+        try:
+            return cls(parts)
+        except ValueError:
+            return None
+
+    def __len__(self) -> int:
+        return self.len
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            block = self._read(_BLOCK_SIZE)
+            if not block:
+                return
+            yield block
+
+    def _read(self, size: int = -1) -> bytes:
+        """Read up to size bytes of the encoded body (everything left if negative)."""
+        if size is None or size < 0:
+            size = self.len - self._position
+        chunks = []
+        while size > 0 and self._index < len(self._segments):
+            segment = self._segments[self._index]
+            segment_size = len(segment) if isinstance(segment, bytes) else segment[2]
+            remaining = segment_size - self._offset
+            if remaining > 0:
+                if isinstance(segment, bytes):
+                    chunk = segment[self._offset:self._offset + size]
+                else:
+                    chunk = segment[0].read(min(size, remaining))
+                    if not chunk:
+                        raise IOError("File was truncated while it was being uploaded")
+                chunks.append(chunk)
+                size -= len(chunk)
+                self._offset += len(chunk)
+                self._position += len(chunk)
+            if self._offset >= segment_size:
+                self._index += 1
+                self._offset = 0
+        return b"".join(chunks)
+
+    def tell(self) -> int:
+        """Return the number of body bytes read so far."""
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        """Rewind to the start of the body; only seek(0) is supported."""
+        if offset != 0 or whence != os.SEEK_SET:
+            raise io.UnsupportedOperation("MultipartStream can only seek to the start")
+        for segment in self._segments:
+            if not isinstance(segment, bytes):
+                file_obj, start, _ = segment
+                file_obj.seek(start)
+        self._index = 0
+        self._offset = 0
+        self._position = 0
+        return 0
@@ -0,0 +1,55 @@
+"""
+Offset pagination helpers for the Mammoth Analytics SDK.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+
+def iter_pages(
+    fetch_page: Callable[[int], List[T]],
+    page_size: int,
+    window: int
+) -> Iterator[T]:
+    """
+    Yield items from consecutive offset pages, fetching ahead of the caller.
+
+    Up to window pages are requested concurrently, so the network round trip
+    for the next pages overlaps with the caller consuming the current one.
+    Iteration stops at the first page holding fewer than page_size items.
+
+    Args:
+        fetch_page: Callable returning the items at a given offset
+        page_size: Number of items requested per page
+        window: Number of pages kept in flight
+
+    Yields:
+        Items in offset order
+
+    Raises:
+        ValueError: If page_size or window is less than 1
+    """
+    if page_size < 1 or window < 1:
+        raise ValueError("page_size and window must be at least 1")
+
+    executor = ThreadPoolExecutor(max_workers=window)
+    pending: Deque[Future] = deque()
+    next_offset = 0
+    try:
+        for _ in range(window):
+            pending.append(executor.submit(fetch_page, next_offset))
+            next_offset += page_size
+
+        while pending:
+            items = pending.popleft().result()
+            if len(items) < page_size:
+                yield from items
+                return
+            pending.append(executor.submit(fetch_page, next_offset))
+            next_offset += page_size
+            yield from items
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
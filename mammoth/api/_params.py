@@ -0,0 +1,27 @@
+"""
+Query parameter helpers for the Mammoth Analytics SDK.
+"""
+
+from enum import Enum
+from typing import Any, Dict, Iterable, Tuple
+
+
+def build_params(spec: Iterable[Tuple[str, Any, Any]]) -> Dict[str, Any]:
+    """
+    Build query parameters from (name, value, default) entries.
+    
+    Lists and tuples are sent comma-separated and enum members as their value.
+    Entries whose value is None or equal to its default after that conversion
+    are left out.
+    """
+    params = {}
+    for name, value, default in spec:
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            value = ",".join(str(item) for item in value)
+        elif isinstance(value, Enum):
+            value = value.value
+        if value != default:
+            params[name] = value
+    return params
@@ -2,22 +2,68 @@
 Exports API client for managing dataview pipeline exports in Mammoth.
 """
 
-from typing import Optional, Union
+import asyncio
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Union
 from ..models.exports import (
     PipelineExportsPaginated, AddExportSpec, PipelineExportsModificationResp,
-    HandlerType, TriggerType, ExportStatus
+    HandlerType, TriggerType, ExportStatus, S3TargetProperties, ItemExportInfo
 )
-from ..models.jobs import JobResponse
+from ..models.jobs import JobResponse, JobStatus
+from ..exceptions import MammothJobTimeoutError
+from ._pagination import iter_pages
+from ._params import build_params
 from pathlib import Path
 import requests
+import urllib3
+
+# Block size used when copying a download to disk
+_DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Longest server-side wait requested for a CSV export, in seconds
+_MAX_PREFER_WAIT = 120
+
+# S3 target properties shared by every download_dataview_csv export
+_CSV_TARGET_PROPERTIES = {
+    "file_type": "csv",
+    "include_hidden": False,
+    "is_format_set": True,
+    "use_format": True
+}
 
 
 class ExportsAPI:
     """Client for interacting with Mammoth Exports API."""
     
+    # Pipeline exports collection of a dataview: workspace, project, dataset, dataview IDs
+    _EXPORTS = "/workspaces/{}/projects/{}/datasets/{}/dataviews/{}/pipeline/exports"
+    
     def __init__(self, client):
         self._client = client
     
+    def for_dataview(
+        self,
+        workspace_id: int,
+        project_id: int,
+        dataset_id: int,
+        dataview_id: int
+    ) -> "DataviewExportsAPI":
+        """
+        Get an exports client bound to a single dataview.
+        
+        Args:
+            workspace_id: ID of the workspace
+            project_id: ID of the project
+            dataset_id: ID of the dataset
+            dataview_id: ID of the dataview
+            
+        Returns:
+            DataviewExportsAPI: Exports client whose methods omit the four IDs
+        """
+        return DataviewExportsAPI(self, workspace_id, project_id, dataset_id, dataview_id)
+    
     def list_exports(
         self,
         workspace_id: int,
@@ -33,7 +79,8 @@ class ExportsAPI:
         reordered: Optional[bool] = None,
         handler_type: Optional[HandlerType] = None,
         end_of_pipeline: Optional[bool] = None,
-        runnable: Optional[bool] = None
+        runnable: Optional[bool] = None,
+        cache: bool = False
     ) -> PipelineExportsPaginated:
         """
         Get dataview pipeline exports information with optional filtering and pagination.
@@ -53,6 +100,7 @@ class ExportsAPI:
             handler_type: Filter by handler type
             end_of_pipeline: Filter by end of pipeline status
             runnable: Filter by runnable status
+            cache: Reuse a recent identical response from the client's cache (default: False)
             
         Returns:
             PipelineExportsPaginated: Paginated list of exports
@@ -60,35 +108,65 @@ class ExportsAPI:
         Raises:
             MammothAPIError: If the API request fails
         """
-        params = {}
-        
-        if fields:
-            params["fields"] = fields
-        if limit != 50:
-            params["limit"] = limit
-        if offset != 0:
-            params["offset"] = offset
-        if sort:
-            params["sort"] = sort
-        if sequence is not None:
-            params["sequence"] = sequence
-        if status is not None:
-            params["status"] = status.value
-        if reordered is not None:
-            params["reorderd"] = reordered  # Note: API uses "reorderd" (typo in API)
-        if handler_type is not None:
-            params["handler_type"] = handler_type.value
-        if end_of_pipeline is not None:
-            params["end_of_pipeline"] = end_of_pipeline
-        if runnable is not None:
-            params["runnable"] = runnable
-            
+        params = build_params((
+            ("fields", fields, ""),
+            ("limit", limit, 50),
+            ("offset", offset, 0),
+            ("sort", sort, ""),
+            ("sequence", sequence, None),
+            ("status", status, None),
+            ("reorderd", reordered, None),  # Note: API uses "reorderd" (typo in API)
+            ("handler_type", handler_type, None),
+            ("end_of_pipeline", end_of_pipeline, None),
+            ("runnable", runnable, None),
+        ))
+        
         response = self._client._request(
             "GET",
-            f"/workspaces/{workspace_id}/projects/{project_id}/datasets/{dataset_id}/dataviews/{dataview_id}/pipeline/exports",
-            params=params
+            self._EXPORTS.format(workspace_id, project_id, dataset_id, dataview_id),
+            params=params,
+            use_cache=cache
         )
-        return PipelineExportsPaginated(**response)
+        return PipelineExportsPaginated.model_validate(response)
+    
+    def iter_exports(
+        self,
+        workspace_id: int,
+        project_id: int,
+        dataset_id: int,
+        dataview_id: int,
+        page_size: int = 100,
+        window: int = 4,
+        **filters: Any
+    ) -> Iterator[ItemExportInfo]:
+        """
+        Iterate over all exports of a dataview, prefetching pages ahead.
+        
+        Pages are requested window at a time on the client's connection pool,
+        overlapping network latency with processing of the current page.
+        
+        Args:
+            workspace_id: ID of the workspace
+            project_id: ID of the project
+            dataset_id: ID of the dataset
+            dataview_id: ID of the dataview
+            page_size: Number of exports requested per page (1-100, default: 100)
+            window: Number of pages kept in flight (default: 4)
+            **filters: Additional list_exports arguments (fields, sort, status, ...)
+            
+        Yields:
+            ItemExportInfo: Each export, in listing order
+            
+        Raises:
+            MammothAPIError: If an API request fails
+        """
+        def fetch_page(offset: int) -> List[ItemExportInfo]:
+            return self.list_exports(
+                workspace_id, project_id, dataset_id, dataview_id,
+                limit=page_size, offset=offset, **filters
+            ).exports
+        
+        return iter_pages(fetch_page, page_size, window)
     
     def add_export(
         self,
@@ -115,18 +193,87 @@ class ExportsAPI:
         Raises:
             MammothAPIError: If the API request fails
         """
+        return self._post_export(workspace_id, project_id, dataset_id, dataview_id, export_spec)
+    
+    def _post_export(
+        self,
+        workspace_id: int,
+        project_id: int,
+        dataset_id: int,
+        dataview_id: int,
+        export_spec: AddExportSpec,
+        wait: Optional[int] = None
+    ) -> Union[PipelineExportsModificationResp, JobResponse]:
+        """
+        POST an export spec. See add_export.
+        
+        When wait is set, the server is asked to hold the response for up to
+        wait seconds until the job finishes, and the read timeout is extended
+        to match so the request is not abandoned (and retried) early.
+        """
+        headers = {"Content-Type": "application/json"}
+        request_kwargs: Dict[str, Any] = {}
+        if wait:
+            headers["Prefer"] = f"wait={wait}"
+            request_kwargs["timeout"] = self._client.timeout + wait
+        
+        # pydantic-core serializes straight to JSON bytes, skipping the
+        # intermediate dict and requests' json.dumps
         response = self._client._request(
             "POST",
-            f"/workspaces/{workspace_id}/projects/{project_id}/datasets/{dataset_id}/dataviews/{dataview_id}/pipeline/exports",
-            json=export_spec.dict()
+            self._EXPORTS.format(workspace_id, project_id, dataset_id, dataview_id),
+            data=export_spec.model_dump_json().encode(),
+            headers=headers,
+            **request_kwargs
         )
         
         # Check if response contains job information (202 response)
         if "job" in response:
-            return JobResponse(**response)
+            return JobResponse.model_validate(response)
         else:
             # Assume it's a modification response (201)
-            return PipelineExportsModificationResp(**response)
+            return PipelineExportsModificationResp.model_validate(response)
+
+    def add_exports_bulk(
+        self,
+        workspace_id: int,
+        project_id: int,
+        dataset_id: int,
+        dataview_id: int,
+        export_specs: List[AddExportSpec],
+        max_concurrency: int = 8
+    ) -> List[Union[PipelineExportsModificationResp, JobResponse]]:
+        """
+        Add several exports to the same dataview pipeline concurrently.
+        
+        Each export is still created by its own request, but up to
+        max_concurrency of them are in flight at once over the client's
+        shared connection pool, so the total time approaches that of the
+        slowest request rather than the sum of all of them.
+        
+        Args:
+            workspace_id: ID of the workspace
+            project_id: ID of the project
+            dataset_id: ID of the dataset
+            dataview_id: ID of the dataview
+            export_specs: Export specifications to add
+            max_concurrency: Maximum number of requests in flight (default: 8)
+            
+        Returns:
+            List of add_export results, in the same order as export_specs
+            
+        Raises:
+            ValueError: If max_concurrency is less than 1
+            MammothAPIError: If any of the API requests fails
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        
+        def add_one(export_spec: AddExportSpec):
+            return self.add_export(workspace_id, project_id, dataset_id, dataview_id, export_spec)
+        
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(export_specs) or 1)) as executor:
+            return list(executor.map(add_one, export_specs))
     
     def create_s3_export(
         self,
@@ -173,8 +320,6 @@ class ExportsAPI:
         Returns:
             PipelineExportsModificationResp or JobResponse: Result of the operation
         """
-        from ..models.exports import S3TargetProperties
-        
         target_properties = S3TargetProperties(
             file=file,
             file_type=file_type,
@@ -275,6 +420,11 @@ class ExportsAPI:
         This utility function creates a CSV export job, waits for completion, 
         and downloads the resulting CSV file from the provided URL.
         
+        The export request asks the server to hold the response until the job
+        finishes (RFC 7240 "Prefer: wait"). Servers that honour it return the
+        completed job directly and no status polling is needed; otherwise the
+        job is polled as usual.
+        
         Args:
             workspace_id: ID of the workspace
             project_id: ID of the project
@@ -304,11 +454,8 @@ class ExportsAPI:
             handler_type=HandlerType.S3,
             trigger_type=TriggerType.NONE,
             target_properties={
-                "file": f"temp_export_{dataset_id}_{dataview_id}.csv",
-                "file_type": "csv",
-                "include_hidden": False,
-                "is_format_set": True,
-                "use_format": True
+                **_CSV_TARGET_PROPERTIES,
+                "file": f"temp_export_{dataset_id}_{dataview_id}.csv"
             },
             additional_properties={},
             condition={},
@@ -317,8 +464,18 @@ class ExportsAPI:
             end_of_pipeline=True
         )
         
-        # Create the export job
-        export_result = self.add_export(workspace_id, project_id, dataset_id, dataview_id, export_spec)
+        # Create the export job, letting the server wait for it to finish if it can
+        start_time = time.monotonic()
+        export_result = self._post_export(
+            workspace_id, project_id, dataset_id, dataview_id, export_spec,
+            wait=min(timeout, _MAX_PREFER_WAIT)
+        )
+        if (
+            isinstance(export_result, JobResponse)
+            and export_result.job.status == JobStatus.SUCCESS
+            and 'url' in export_result.job.response
+        ):
+            return self._download_file(export_result.job.response['url'], output_path)
         
         # Extract job ID from the result
         job_id = None
@@ -331,8 +488,14 @@ class ExportsAPI:
         if not job_id:
             raise ValueError("Export job was not created successfully - no job ID returned")
         
-        # Wait for job completion using the existing jobs API
-        completed_job = self._client.jobs.wait_for_job(job_id, timeout=timeout)
+        # Wait for job completion using the existing jobs API; time the server
+        # already spent holding the export request counts against the timeout
+        remaining = max(0, timeout - (time.monotonic() - start_time))
+        try:
+            completed_job = self._client.jobs.wait_for_job(job_id, timeout=remaining)
+        except MammothJobTimeoutError:
+            # Report the caller's timeout rather than the part left for polling
+            raise MammothJobTimeoutError(job_id, timeout) from None
         
         # Extract download URL from job response
         if not completed_job.response or 'url' not in completed_job.response:
@@ -343,6 +506,33 @@ class ExportsAPI:
         # Download the CSV file
         return self._download_file(download_url, output_path)
     
+    async def adownload_dataview_csv(
+        self,
+        workspace_id: int,
+        project_id: int,
+        dataset_id: int,
+        dataview_id: int,
+        output_path: Optional[Union[str, Path]] = None,
+        timeout: int = 300
+    ) -> Path:
+        """
+        Async version of download_dataview_csv.
+        
+        The export, wait and download run in a worker thread on the client's
+        connection pool, so several dataviews can be downloaded concurrently
+        with asyncio.gather. Arguments and return value are the same as
+        download_dataview_csv.
+        """
+        return await asyncio.to_thread(
+            self.download_dataview_csv,
+            workspace_id,
+            project_id,
+            dataset_id,
+            dataview_id,
+            output_path=output_path,
+            timeout=timeout
+        )
+    
     def _download_file(self, url: str, output_path: Path) -> Path:
         """
         Download a file from the given URL.
@@ -359,23 +549,99 @@ class ExportsAPI:
         """
         try:
             # Use the client's session to maintain authentication if needed
-            response = self._client.session.get(url, stream=True, timeout=self._client.timeout)
-            response.raise_for_status()
-            
-            # Create directory if it doesn't exist
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Download file in chunks
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            with self._client.session.get(url, stream=True, timeout=self._client.timeout) as response:
+                response.raise_for_status()
+                
+                # Create directory if it doesn't exist
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                
+                # Copy straight from the socket in large blocks, letting urllib3
+                # undo any gzip/deflate transfer encoding
+                response.raw.decode_content = True
+                with open(output_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, _DOWNLOAD_CHUNK_SIZE)
             
             return output_path
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
             from ..exceptions import MammothAPIError
             raise MammothAPIError(f"Failed to download file: {str(e)}")
         except IOError as e:
             from ..exceptions import MammothAPIError
             raise MammothAPIError(f"Failed to save file: {str(e)}")
+
+
+class DataviewExportsAPI:
+    """
+    Exports client scoped to one dataview.
+    
+    Obtained from ExportsAPI.for_dataview(); each method is the ExportsAPI
+    method of the same name with the workspace, project, dataset and
+    dataview IDs already filled in.
+    """
+    
+    def __init__(
+        self,
+        exports: ExportsAPI,
+        workspace_id: int,
+        project_id: int,
+        dataset_id: int,
+        dataview_id: int
+    ):
+        self._exports = exports
+        self._ids = (workspace_id, project_id, dataset_id, dataview_id)
+    
+    def list_exports(self, **kwargs: Any) -> PipelineExportsPaginated:
+        """List the dataview's exports. See ExportsAPI.list_exports."""
+        return self._exports.list_exports(*self._ids, **kwargs)
+    
+    def iter_exports(self, **kwargs: Any) -> Iterator[ItemExportInfo]:
+        """Iterate over all of the dataview's exports. See ExportsAPI.iter_exports."""
+        return self._exports.iter_exports(*self._ids, **kwargs)
+    
+    def add_export(
+        self,
+        export_spec: AddExportSpec
+    ) -> Union[PipelineExportsModificationResp, JobResponse]:
+        """Add an export to the dataview pipeline. See ExportsAPI.add_export."""
+        return self._exports.add_export(*self._ids, export_spec)
+    
+    def add_exports_bulk(
+        self,
+        export_specs: List[AddExportSpec],
+        max_concurrency: int = 8
+    ) -> List[Union[PipelineExportsModificationResp, JobResponse]]:
+        """Add several exports concurrently. See ExportsAPI.add_exports_bulk."""
+        return self._exports.add_exports_bulk(*self._ids, export_specs, max_concurrency)
+    
+    def create_s3_export(
+        self,
+        file: str,
+        **kwargs: Any
+    ) -> Union[PipelineExportsModificationResp, JobResponse]:
+        """Create an S3 export. See ExportsAPI.create_s3_export."""
+        return self._exports.create_s3_export(*self._ids, file, **kwargs)
+    
+    def create_internal_dataset_export(
+        self,
+        dataset_name: str,
+        **kwargs: Any
+    ) -> Union[PipelineExportsModificationResp, JobResponse]:
+        """Create an internal dataset export. See ExportsAPI.create_internal_dataset_export."""
+        return self._exports.create_internal_dataset_export(*self._ids, dataset_name, **kwargs)
+    
+    def download_dataview_csv(
+        self,
+        output_path: Optional[Union[str, Path]] = None,
+        timeout: int = 300
+    ) -> Path:
+        """Download the dataview as CSV. See ExportsAPI.download_dataview_csv."""
+        return self._exports.download_dataview_csv(*self._ids, output_path, timeout)
+    
+    async def adownload_dataview_csv(
+        self,
+        output_path: Optional[Union[str, Path]] = None,
+        timeout: int = 300
+    ) -> Path:
+        """Async version of download_dataview_csv. See ExportsAPI.adownload_dataview_csv."""
+        return await self._exports.adownload_dataview_csv(*self._ids, output_path, timeout)
@@ -2,21 +2,84 @@
 Files API client for managing files and datasets in Mammoth.
 """
 
+import asyncio
+import hashlib
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Union, BinaryIO
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, BinaryIO
+from pydantic import TypeAdapter
 from ..models.files import (
     FilesList, FileDetails, FileSchema, FilePatchRequest, 
     FilePatchData, FilePatchOperation, FilePatchPath
 )
 from ..models.jobs import ObjectJobSchema
+from ._multipart import MultipartStream
+from ._pagination import iter_pages
+from ._params import build_params
+
+# Validates a whole upload response in one pydantic-core call
+_OBJECT_JOBS = TypeAdapter(List[ObjectJobSchema])
+
+# Block size used when hashing files for upload deduplication
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def _upload_name(file_input: Union[str, Path, BinaryIO]) -> str:
+    """Return the file name an input is uploaded under."""
+    if isinstance(file_input, (str, Path)):
+        return Path(file_input).name
+    # fd-backed objects (os.fdopen, tempfile.TemporaryFile) have an int name
+    filename = getattr(file_input, 'name', None)
+    if isinstance(filename, bytes):
+        filename = os.fsdecode(filename)
+    if not isinstance(filename, str) or not filename:
+        return 'uploaded_file'
+    return os.path.basename(filename)
+
+
+def _content_digest(file_input: Union[str, Path, BinaryIO]) -> Optional[str]:
+    """
+    Return a BLAKE2b digest of the content an input would upload.
+    
+    File-like objects are hashed from their current position and rewound
+    afterwards. Returns None for missing paths, unseekable streams and
+    text-mode files.
+    """
+    if isinstance(file_input, io.TextIOBase):
+        return None
+    hasher = hashlib.blake2b()
+    if isinstance(file_input, (str, Path)):
+        if not os.path.isfile(file_input):
+            return None
+        with open(file_input, 'rb') as f:
+            for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b''):
+                hasher.update(block)
+        return hasher.hexdigest()
+    
+    try:
+        start = file_input.tell()
+        for block in iter(lambda: file_input.read(_HASH_BLOCK_SIZE), b''):
+            hasher.update(block)
+        file_input.seek(start)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+    return hasher.hexdigest()
 
 
 class FilesAPI:
     """Client for interacting with Mammoth Files API."""
     
+    # Files collection of a project and a single file in it: workspace, project(, file) IDs
+    _FILES = "/workspaces/{}/projects/{}/files"
+    _FILE = "/workspaces/{}/projects/{}/files/{}"
+    
     def __init__(self, client):
         self._client = client
+        # Dataset IDs of uploads made with dedup=True, keyed on
+        # (workspace, project, folder, file name, content digest)
+        self._uploaded: Dict[Tuple[int, int, Optional[str], str, str], int] = {}
     
     def list_files(
         self,
@@ -30,7 +93,8 @@ class FilesAPI:
         updated_at: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
-        sort: Optional[str] = None
+        sort: Optional[str] = None,
+        cache: bool = False
     ) -> FilesList:
         """
         List files in a project with optional filtering and pagination.
@@ -47,6 +111,7 @@ class FilesAPI:
             limit: Maximum number of results (0-100, default: 50)
             offset: Number of results to skip (default: 0)
             sort: Sort specification (e.g., "(id:asc),(name:desc)")
+            cache: Reuse a recent identical response from the client's cache (default: False)
             
         Returns:
             FilesList: List of files with pagination info
@@ -54,40 +119,68 @@ class FilesAPI:
         Raises:
             MammothAPIError: If the API request fails
         """
-        params = {}
+        params = build_params((
+            ("fields", fields, ""),
+            ("id", file_ids, ""),
+            ("name", names, ""),
+            ("status", statuses, ""),
+            ("created_at", created_at, ""),
+            ("updated_at", updated_at, ""),
+            ("limit", limit, 50),
+            ("offset", offset, 0),
+            ("sort", sort, ""),
+        ))
         
-        if fields:
-            params["fields"] = fields
-        if file_ids:
-            params["id"] = ",".join(str(fid) for fid in file_ids)
-        if names:
-            params["name"] = ",".join(names)
-        if statuses:
-            params["status"] = ",".join(statuses)
-        if created_at:
-            params["created_at"] = created_at
-        if updated_at:
-            params["updated_at"] = updated_at
-        if limit != 50:
-            params["limit"] = limit
-        if offset != 0:
-            params["offset"] = offset
-        if sort:
-            params["sort"] = sort
-            
         response = self._client._request(
             "GET",
-            f"/workspaces/{workspace_id}/projects/{project_id}/files",
-            params=params
+            self._FILES.format(workspace_id, project_id),
+            params=params,
+            use_cache=cache
         )
-        return FilesList(**response)
+        return FilesList.model_validate(response)
+    
+    def iter_files(
+        self,
+        workspace_id: int,
+        project_id: int,
+        page_size: int = 100,
+        window: int = 4,
+        **filters: Any
+    ) -> Iterator[FileSchema]:
+        """
+        Iterate over all files in a project, prefetching pages ahead.
+        
+        Pages are requested window at a time on the client's connection pool,
+        overlapping network latency with processing of the current page.
+        
+        Args:
+            workspace_id: ID of the workspace
+            project_id: ID of the project
+            page_size: Number of files requested per page (1-100, default: 100)
+            window: Number of pages kept in flight (default: 4)
+            **filters: Additional list_files arguments (fields, names, statuses, ...)
+            
+        Yields:
+            FileSchema: Each file, in listing order
+            
+        Raises:
+            MammothAPIError: If an API request fails
+        """
+        def fetch_page(offset: int) -> List[FileSchema]:
+            return self.list_files(
+                workspace_id, project_id,
+                limit=page_size, offset=offset, **filters
+            ).files
+        
+        return iter_pages(fetch_page, page_size, window)
     
     def get_file_details(
         self,
         workspace_id: int,
         project_id: int,
         file_id: int,
-        fields: Optional[str] = None
+        fields: Optional[str] = None,
+        cache: bool = False
     ) -> FileSchema:
         """
         Get detailed information about a specific file.
@@ -97,6 +190,7 @@ class FilesAPI:
             project_id: ID of the project
             file_id: ID of the file
             fields: Fields to return (default: "__standard")
+            cache: Reuse a recent identical response from the client's cache (default: False)
             
         Returns:
             FileSchema: Detailed file information
@@ -110,10 +204,11 @@ class FilesAPI:
             
         response = self._client._request(
             "GET",
-            f"/workspaces/{workspace_id}/projects/{project_id}/files/{file_id}",
-            params=params
+            self._FILE.format(workspace_id, project_id, file_id),
+            params=params,
+            use_cache=cache
         )
-        file_details = FileDetails(**response)
+        file_details = FileDetails.model_validate(response)
         return file_details.file
     
     def upload_files(
@@ -125,13 +220,21 @@ class FilesAPI:
         append_to_ds_id: Optional[int] = None,
         override_target_schema: Optional[bool] = None,
         wait_for_completion: bool = True,
-        timeout: int = 300
+        timeout: int = 300,
+        dedup: bool = False
     ) -> Union[List[int], int, None]:
         """
         Upload one or more files to create datasets. Each file will be treated as a
         separate dataset. If the file path contains a folder structure, that structure
         will be preserved, and the files will be placed in their respective folders.
         
+        With dedup=True, a file whose name and content match an earlier dedup
+        upload by this client to the same workspace, project and folder is not
+        sent again; the dataset ID from that upload is returned instead. The
+        remembered ID is not re-validated with the server, so a dataset deleted
+        since then is still returned.
+        Deduplication applies only when waiting for completion and not appending.
+        
         Args:
             workspace_id: ID of the workspace
             project_id: ID of the project
@@ -141,6 +244,7 @@ class FilesAPI:
             override_target_schema: Whether to override target schema when appending
             wait_for_completion: Whether to wait for upload processing to complete
             timeout: Timeout in seconds when waiting for completion
+            dedup: Skip files already uploaded by this client (default: False)
             
         Returns:
             List of dataset IDs if multiple files uploaded, single dataset ID if one file
@@ -154,8 +258,13 @@ class FilesAPI:
         if not isinstance(files, list):
             files = [files]
         
+        if dedup and wait_for_completion and append_to_ds_id is None:
+            return self._upload_deduplicated(
+                workspace_id, project_id, files, folder_resource_id, timeout
+            )
+        
         # Prepare files for upload
-        file_data = []
+        file_parts = []
         opened_files = []
         
         try:
@@ -166,13 +275,23 @@ class FilesAPI:
                         raise ValueError(f"File not found: {file_path}")
                     file_obj = open(file_path, 'rb')
                     opened_files.append(file_obj)
-                    file_data.append(('files', (file_path.name, file_obj, 'application/octet-stream')))
+                    if hasattr(os, 'posix_fadvise'):
+                        # Hint the kernel to read ahead aggressively while streaming
+                        os.posix_fadvise(file_obj.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    file_parts.append(('files', file_path.name, file_obj, 'application/octet-stream'))
                 else:
                     # Assume it's a file-like object
-                    filename = getattr(file_input, 'name', 'uploaded_file')
-                    if hasattr(filename, 'split'):
-                        filename = os.path.basename(filename)
-                    file_data.append(('files', (filename, file_input, 'application/octet-stream')))
+                    file_parts.append(('files', _upload_name(file_input), file_input, 'application/octet-stream'))
+            
+            # Stream the body from disk when every part is a sized binary file; fall
+            # back to requests' in-memory encoding for pipes and text-mode files
+            body = MultipartStream.from_parts(file_parts)
+            if body is not None:
+                upload_kwargs = {'data': body, 'headers': {'Content-Type': body.content_type}}
+            else:
+                upload_kwargs = {
+                    'files': [(field, (name, obj, ctype)) for field, name, obj, ctype in file_parts]
+                }
             
             # Prepare parameters
             params = {}
@@ -186,9 +305,9 @@ class FilesAPI:
             # Make upload request
             response = self._client._request(
                 "POST",
-                f"/workspaces/{workspace_id}/projects/{project_id}/files",
+                self._FILES.format(workspace_id, project_id),
                 params=params,
-                files=file_data
+                **upload_kwargs
             )
             
         finally:
@@ -197,7 +316,7 @@ class FilesAPI:
                 file_obj.close()
         
         # Parse job response
-        obj_jobs = [ObjectJobSchema(**obj_job) for obj_job in response]
+        obj_jobs = _OBJECT_JOBS.validate_python(response)
         job_ids = [job.job_id for job in obj_jobs if job.job_id is not None]
         
         if not wait_for_completion:
@@ -216,6 +335,151 @@ class FilesAPI:
             return valid_dataset_ids
         
         return [] if len(files) > 1 else None
+
+    def _upload_deduplicated(
+        self,
+        workspace_id: int,
+        project_id: int,
+        files: List[Union[str, Path, BinaryIO]],
+        folder_resource_id: Optional[str],
+        timeout: int
+    ) -> Union[List[int], int, None]:
+        """Upload only the files not already uploaded by this client. See upload_files."""
+        keys = []
+        for file_input in files:
+            digest = _content_digest(file_input)
+            keys.append(
+                (workspace_id, project_id, folder_resource_id, _upload_name(file_input), digest)
+                if digest is not None else None
+            )
+        dataset_ids = [self._uploaded.get(key) if key else None for key in keys]
+        
+        pending = [i for i, ds_id in enumerate(dataset_ids) if ds_id is None]
+        
+        if pending:
+            uploaded = self.upload_files(
+                workspace_id,
+                project_id,
+                [files[i] for i in pending],
+                folder_resource_id=folder_resource_id,
+                timeout=timeout
+            )
+            if not isinstance(uploaded, list):
+                uploaded = [] if uploaded is None else [uploaded]
+            
+            if len(uploaded) == len(pending):
+                for i, ds_id in zip(pending, uploaded):
+                    dataset_ids[i] = ds_id
+                    if keys[i] is not None:
+                        self._uploaded[keys[i]] = ds_id
+            else:
+                # Some files produced no dataset, so the new IDs can't be
+                # matched to their files; return them after the known ones
+                dataset_ids = [ds_id for ds_id in dataset_ids if ds_id is not None] + uploaded
+        
+        if len(files) == 1:
+            return dataset_ids[0] if dataset_ids else None
+        return dataset_ids
+    
+    async def aupload_files(
+        self,
+        workspace_id: int,
+        project_id: int,
+        files: Union[List[Union[str, Path, BinaryIO]], str, Path, BinaryIO],
+        folder_resource_id: Optional[str] = None,
+        append_to_ds_id: Optional[int] = None,
+        override_target_schema: Optional[bool] = None,
+        wait_for_completion: bool = True,
+        timeout: int = 300,
+        dedup: bool = False
+    ) -> Union[List[int], int, None]:
+        """
+        Async version of upload_files.
+        
+        The upload runs in a worker thread on the client's connection pool, so
+        several calls can be awaited concurrently with asyncio.gather without
+        blocking the event loop. Arguments and return value are the same as
+        upload_files.
+        """
+        return await asyncio.to_thread(
+            self.upload_files,
+            workspace_id,
+            project_id,
+            files,
+            folder_resource_id=folder_resource_id,
+            append_to_ds_id=append_to_ds_id,
+            override_target_schema=override_target_schema,
+            wait_for_completion=wait_for_completion,
+            timeout=timeout,
+            dedup=dedup
+        )
+
+    def upload_files_parallel(
+        self,
+        workspace_id: int,
+        project_id: int,
+        files: List[Union[str, Path, BinaryIO]],
+        folder_resource_id: Optional[str] = None,
+        wait_for_completion: bool = True,
+        timeout: int = 300,
+        max_concurrency: int = 8
+    ) -> Union[List[Optional[int]], List[List[int]]]:
+        """
+        Upload several files concurrently, one request per file.
+        
+        Unlike upload_files, which sends every file in a single multipart
+        request, each file is posted from its own worker thread so that slow
+        uploads overlap instead of running back to back. All workers share the
+        client's HTTP session and connection pool. The resulting jobs are then
+        tracked together with a single wait_for_jobs call.
+        
+        Args:
+            workspace_id: ID of the workspace
+            project_id: ID of the project
+            files: Files to upload - file paths, Path objects, or file-like objects
+            folder_resource_id: Resource ID of target folder
+            wait_for_completion: Whether to wait for upload processing to complete
+            timeout: Timeout in seconds when waiting for all uploads to complete
+            max_concurrency: Maximum number of uploads in flight (default: 8)
+            
+        Returns:
+            One entry per input file, in input order: the dataset ID (or None)
+            when waiting for completion, otherwise the list of created job IDs
+            
+        Raises:
+            ValueError: If max_concurrency is less than 1
+            MammothAPIError: If any upload request fails
+            MammothJobTimeoutError: If job processing times out
+            MammothJobFailedError: If job processing fails
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        
+        def upload_one(file_input):
+            return self.upload_files(
+                workspace_id,
+                project_id,
+                file_input,
+                folder_resource_id=folder_resource_id,
+                wait_for_completion=False
+            )
+        
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(files) or 1)) as executor:
+            job_ids_per_file = list(executor.map(upload_one, files))
+        
+        if not wait_for_completion:
+            return job_ids_per_file
+        
+        all_job_ids = [job_id for job_ids in job_ids_per_file for job_id in job_ids]
+        if not all_job_ids:
+            return [None] * len(files)
+        
+        completed_jobs = self._client.jobs.wait_for_jobs(all_job_ids, timeout=timeout)
+        dataset_by_job = {job.id: job.response.get('ds_id') for job in completed_jobs}
+        return [
+            next((dataset_by_job[job_id] for job_id in job_ids if dataset_by_job.get(job_id) is not None), None)
+            for job_ids in job_ids_per_file
+        ]
     
     def delete_file(
         self,
@@ -236,32 +500,40 @@ class FilesAPI:
         """
         self._client._request(
             "DELETE",
-            f"/workspaces/{workspace_id}/projects/{project_id}/files/{file_id}"
+            self._FILE.format(workspace_id, project_id, file_id)
         )
     
     def delete_files(
         self,
         workspace_id: int,
         project_id: int,
-        file_ids: List[int]
+        file_ids: List[int],
+        batch_size: int = 200
     ) -> None:
         """
         Delete multiple files.
         
+        The IDs are sent batch_size at a time so large deletions stay within
+        the URL length limits of the server and any proxies in between.
+        
         Args:
             workspace_id: ID of the workspace
             project_id: ID of the project
             file_ids: List of file IDs to delete
+            batch_size: Maximum number of IDs sent per request (default: 200)
             
         Raises:
+            ValueError: If batch_size is less than 1
             MammothAPIError: If the API request fails
         """
-        params = {"ids": ",".join(str(fid) for fid in file_ids)}
-        self._client._request(
-            "DELETE",
-            f"/workspaces/{workspace_id}/projects/{project_id}/files",
-            params=params
-        )
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        
+        endpoint = self._FILES.format(workspace_id, project_id)
+        for start in range(0, len(file_ids), batch_size):
+            batch = file_ids[start:start + batch_size]
+            params = {"ids": ",".join(str(fid) for fid in batch)}
+            self._client._request("DELETE", endpoint, params=params)
     
     def update_file_config(
         self,
@@ -287,10 +559,10 @@ class FilesAPI:
         """
         response = self._client._request(
             "PATCH",
-            f"/workspaces/{workspace_id}/projects/{project_id}/files/{file_id}",
-            json=patch_request.dict()
+            self._FILE.format(workspace_id, project_id, file_id),
+            json=patch_request.model_dump(mode="json")
         )
-        return ObjectJobSchema(**response)
+        return ObjectJobSchema.model_validate(response)
     
     def set_file_password(
         self,
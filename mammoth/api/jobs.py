@@ -2,22 +2,188 @@
 Jobs API client for tracking asynchronous operations in Mammoth.
 """
 
+import random
+import threading
 import time
-from typing import List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Generator, Iterator, List, Mapping, Optional, Set, Tuple
 from ..models.jobs import JobResponse, JobsGetResponse, JobSchema, JobStatus
 from ..exceptions import MammothJobTimeoutError, MammothJobFailedError
 
+# Up to this fraction of each delay is added as random jitter
+_POLL_JITTER = 0.1
+# Number of jobs whose last seen state is remembered per client
+_STATUS_CACHE_SIZE = 1024
+_FAILED_STATUSES = frozenset({JobStatus.FAILURE, JobStatus.ERROR})
+_TERMINAL_STATUSES = _FAILED_STATUSES | {JobStatus.SUCCESS}
+# Job IDs sent per /jobs request, keeping URLs well under server limits
+_JOB_IDS_PER_REQUEST = 100
+# Weight of the newest sample in the moving average of job durations
+_DURATION_EWMA_ALPHA = 0.3
+# Fraction of an operation's typical duration used as the first poll delay
+_LEARNED_DELAY_FRACTION = 0.25
+
+
+def _retry_after(headers: Mapping[str, str], body: Any) -> Optional[float]:
+    """
+    Return the server's suggested delay before the next poll, in seconds.
+    
+    Reads a Retry-After header (delta-seconds or HTTP-date) or, failing that,
+    a retry_after_ms field in the JSON body. Returns None when neither is
+    present or parseable.
+    """
+    value = headers.get('Retry-After')
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            pass
+    
+    if isinstance(body, dict):
+        retry_after_ms = body.get('retry_after_ms')
+        if isinstance(retry_after_ms, (int, float)):
+            return max(0.0, retry_after_ms / 1000)
+    return None
+
+
+def _poll_schedule(initial: float, factor: float, cap: float) -> Iterator[float]:
+    """
+    Yield successive delays between status polls.
+    
+    Delays start at initial and are multiplied by factor after every poll,
+    never exceeding cap.
+    
+    Raises:
+        ValueError: If initial is not positive or factor is less than 1
+    """
+    if initial <= 0 or factor < 1:
+        raise ValueError("initial_interval must be positive and backoff_factor at least 1")
+    
+    def delays() -> Iterator[float]:
+        delay = min(initial, cap)
+        while True:
+            yield delay
+            delay = min(delay * factor, cap)
+    
+    return delays()
+
+
+def _advance(waiter: Generator[float, None, Any]) -> Tuple[bool, Any]:
+    """
+    Run a waiter to its next sleep.
+    
+    Returns (False, delay) while it is still waiting and (True, result) once
+    it has finished. A StopIteration can't cross a thread pool future, so
+    asyncio callers step waiters through this.
+    """
+    try:
+        return False, next(waiter)
+    except StopIteration as finished:
+        return True, finished.value
+
+
+def _run_waiter(waiter: Generator[float, None, Any]) -> Any:
+    """Drive a waiter to completion, sleeping for each delay it yields."""
+    while True:
+        finished, value = _advance(waiter)
+        if finished:
+            return value
+        time.sleep(value)
+
 
 class JobsAPI:
     """Client for interacting with Mammoth Jobs API."""
     
+    _JOB = "/jobs/{}"
+    
     def __init__(self, client):
         self._client = client
+        # Last seen state of recently fetched jobs: job ID -> (job, monotonic time)
+        self._status_cache: "OrderedDict[int, Tuple[JobSchema, float]]" = OrderedDict()
+        self._status_lock = threading.Lock()
+        # Moving average of how long succeeded jobs took, per operation, in seconds
+        self._op_durations: Dict[str, float] = {}
+    
+    def _remember(self, jobs: List[JobSchema]) -> None:
+        """Record the latest state of fetched jobs, evicting the oldest entries."""
+        now = time.monotonic()
+        with self._status_lock:
+            for job in jobs:
+                if job.status == JobStatus.SUCCESS:
+                    # Only jobs seen running count: finished jobs fetched
+                    # afterwards (e.g. old ones in a listing) would skew the
+                    # average towards their own, unrelated durations
+                    previous = self._status_cache.get(job.id)
+                    if previous is not None and previous[0].status not in _TERMINAL_STATUSES:
+                        self._record_duration(job)
+                self._status_cache[job.id] = (job, now)
+                self._status_cache.move_to_end(job.id)
+            while len(self._status_cache) > _STATUS_CACHE_SIZE:
+                self._status_cache.popitem(last=False)
+    
+    def _record_duration(self, job: JobSchema) -> None:
+        """Fold a succeeded job's run time into its operation's average. Caller holds the lock."""
+        try:
+            elapsed = (job.last_updated_at - job.created_at).total_seconds()
+        except TypeError:
+            # Naive and aware timestamps can't be compared
+            return
+        if elapsed < 0:
+            return
+        average = self._op_durations.get(job.operation)
+        if average is None:
+            self._op_durations[job.operation] = elapsed
+        else:
+            self._op_durations[job.operation] = average + _DURATION_EWMA_ALPHA * (elapsed - average)
+    
+    def _learned_delay(self, operation: str, initial_interval: float) -> float:
+        """
+        First delay between polls of a job running the given operation.
+        
+        Operations that have typically taken a while start with a longer delay,
+        a fraction of their average duration, instead of initial_interval.
+        """
+        with self._status_lock:
+            average = self._op_durations.get(operation)
+        if average is None:
+            return initial_interval
+        return max(initial_interval, _LEARNED_DELAY_FRACTION * average)
+    
+    def _final_state(self, job_id: int) -> Optional[JobSchema]:
+        """Return the job if it was last seen in a final state, which never changes."""
+        with self._status_lock:
+            entry = self._status_cache.get(job_id)
+            if entry is None or entry[0].status not in _TERMINAL_STATUSES:
+                return None
+            self._status_cache.move_to_end(job_id)
+            return entry[0]
+    
+    def invalidate(self, job_id: Optional[int] = None) -> None:
+        """
+        Forget the remembered state of a job, or of every job.
+        
+        Args:
+            job_id: Job to forget; all jobs are forgotten when None
+        """
+        with self._status_lock:
+            if job_id is None:
+                self._status_cache.clear()
+            else:
+                self._status_cache.pop(job_id, None)
     
     def get_job(self, job_id: int) -> JobSchema:
         """
         Get details of a specific job by its ID.
         
+        Jobs this client has already seen succeed or fail are returned from
+        memory without a request, since their state can no longer change.
+        
         Args:
             job_id: Unique identifier of the job
             
@@ -27,14 +193,28 @@ class JobsAPI:
         Raises:
             MammothAPIError: If the API request fails
         """
-        response = self._client._request("GET", f"/jobs/{job_id}")
-        job_response = JobResponse(**response)
-        return job_response.job
+        return self._poll_job(job_id)[0]
+    
+    def _poll_job(self, job_id: int) -> Tuple[JobSchema, Optional[float]]:
+        """Get a job along with the server's suggested delay before polling it again."""
+        job = self._final_state(job_id)
+        if job is not None:
+            return job, None
+        
+        response, headers = self._client._request(
+            "GET", self._JOB.format(job_id), with_headers=True
+        )
+        job_response = JobResponse.model_validate(response)
+        self._remember([job_response.job])
+        return job_response.job, _retry_after(headers, response)
     
     def get_jobs(self, job_ids: List[int]) -> List[JobSchema]:
         """
         Get details of multiple jobs by their IDs.
         
+        Long ID lists are fetched 100 at a time, with up to the client's
+        max_parallel requests in flight.
+        
         Args:
             job_ids: List of job IDs to retrieve
             
@@ -44,16 +224,37 @@ class JobsAPI:
         Raises:
             MammothAPIError: If the API request fails
         """
-        params = {"job_ids": ",".join(str(jid) for jid in job_ids)}
-        response = self._client._request("GET", "/jobs", params=params)
-        jobs_response = JobsGetResponse(**response)
+        return self._get_jobs([str(jid) for jid in job_ids])
+    
+    def _get_jobs(self, id_strings: List[str]) -> List[JobSchema]:
+        """Fetch jobs by already stringified IDs, in parallel batches. See get_jobs."""
+        chunks = [
+            id_strings[i:i + _JOB_IDS_PER_REQUEST]
+            for i in range(0, len(id_strings), _JOB_IDS_PER_REQUEST)
+        ]
+        if len(chunks) <= 1:
+            return self._fetch_jobs(id_strings)
+        
+        workers = min(self._client.max_parallel, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return [job for jobs in executor.map(self._fetch_jobs, chunks) for job in jobs]
+    
+    def _fetch_jobs(self, id_strings: List[str]) -> List[JobSchema]:
+        """Fetch one batch of jobs with a single /jobs request."""
+        params = {"job_ids": ",".join(id_strings)}
+        # Batches can be large, so let pydantic-core parse the JSON bytes directly
+        response = self._client._request("GET", "/jobs", params=params, raw=True)
+        jobs_response = JobsGetResponse.model_validate_json(response)
+        self._remember(jobs_response.jobs)
         return jobs_response.jobs
     
     def wait_for_job(
         self, 
         job_id: int, 
         timeout: int = 300,
-        poll_interval: int = 5
+        poll_interval: int = 5,
+        initial_interval: float = 0.2,
+        backoff_factor: float = 2.0
     ) -> JobSchema:
         """
         Wait for a job to complete, polling until success or failure.
@@ -61,32 +262,71 @@ class JobsAPI:
         Args:
             job_id: ID of the job to wait for
             timeout: Maximum time to wait in seconds (default: 300)
-            poll_interval: Time between polls in seconds (default: 5)
+            poll_interval: Maximum time between polls in seconds (default: 5).
+                Polling starts at initial_interval and backs off exponentially
+                up to this value, so short jobs are detected quickly. A
+                Retry-After hint from the server takes precedence.
+                Operations this client has seen take longer start with a
+                proportionally longer first delay.
+            initial_interval: Delay before the second poll in seconds (default: 0.2)
+            backoff_factor: Multiplier applied to the delay after each poll (default: 2.0)
             
         Returns:
             JobSchema: Final job details when completed
             
         Raises:
+            ValueError: If initial_interval is not positive or backoff_factor is less than 1
             MammothJobTimeoutError: If job doesn't complete within timeout
             MammothJobFailedError: If job fails during execution
         """
-        start_time = time.time()
+        return _run_waiter(self._job_waiter(
+            job_id, timeout, poll_interval, initial_interval, backoff_factor
+        ))
+    
+    def _job_waiter(
+        self,
+        job_id: int,
+        timeout: float,
+        poll_interval: float,
+        initial_interval: float,
+        backoff_factor: float
+    ) -> Generator[float, None, JobSchema]:
+        """
+        Poll a job until it finishes, yielding the delay to sleep before each
+        further poll and returning the succeeded job.
         
-        while time.time() - start_time < timeout:
-            job = self.get_job(job_id)
+        Sleeping is left to the caller, so wait_for_job and its asyncio
+        counterpart share this loop. See wait_for_job for the arguments and
+        exceptions.
+        """
+        start_time = time.monotonic()
+        delays = _poll_schedule(initial_interval, backoff_factor, poll_interval)
+        first_poll = True
+        
+        while time.monotonic() - start_time < timeout:
+            job, retry_after = self._poll_job(job_id)
             
             if job.status == JobStatus.SUCCESS:
                 return job
-            elif job.status in [JobStatus.FAILURE, JobStatus.ERROR]:
-                failure_reason = None
-                if hasattr(job, 'response') and isinstance(job.response, dict):
-                    failure_reason = job.response.get('failure_reason')
-                raise MammothJobFailedError(job_id, failure_reason)
-            elif job.status == JobStatus.PROCESSING:
-                time.sleep(poll_interval)
+            elif job.status in _FAILED_STATUSES:
+                raise MammothJobFailedError(job_id, job.response.get('failure_reason'))
+            
+            # The operation is only known once the job has been fetched
+            if first_poll:
+                first_poll = False
+                first_delay = self._learned_delay(job.operation, initial_interval)
+                delays = _poll_schedule(first_delay, backoff_factor, poll_interval)
+            
+            # Still processing (or unknown status): wait as long as the server
+            # asked, or back off exponentially up to poll_interval, with jitter
+            # so concurrent waiters don't poll in lockstep
+            if retry_after is not None:
+                delay = retry_after
             else:
-                # Unknown status, continue polling
-                time.sleep(poll_interval)
+                delay = next(delays)
+                delay += random.uniform(0, _POLL_JITTER * delay)
+            remaining = timeout - (time.monotonic() - start_time)
+            yield max(0, min(delay, remaining))
         
         raise MammothJobTimeoutError(job_id, timeout)
     
@@ -94,7 +334,9 @@ class JobsAPI:
         self,
         job_ids: List[int],
         timeout: int = 300,
-        poll_interval: int = 5
+        poll_interval: int = 5,
+        initial_interval: float = 0.2,
+        backoff_factor: float = 2.0
     ) -> List[JobSchema]:
         """
         Wait for multiple jobs to complete.
@@ -102,39 +344,118 @@ class JobsAPI:
         Args:
             job_ids: List of job IDs to wait for
             timeout: Maximum time to wait in seconds (default: 300) 
-            poll_interval: Time between polls in seconds (default: 5)
+            poll_interval: Maximum time between polls in seconds (default: 5).
+                Polling backs off the same way as in wait_for_job.
+            initial_interval: Delay before the second poll in seconds (default: 0.2)
+            backoff_factor: Multiplier applied to the delay after each poll (default: 2.0)
             
         Returns:
-            List[JobSchema]: Final job details for all completed jobs
+            List[JobSchema]: Final job details for all completed jobs, in the
+                order of job_ids
             
         Raises:
+            ValueError: If initial_interval is not positive or backoff_factor is less than 1
             MammothJobTimeoutError: If any job doesn't complete within timeout
             MammothJobFailedError: If any job fails during execution
         """
-        completed_jobs = []
-        remaining_job_ids = job_ids.copy()
-        start_time = time.time()
+        return _run_waiter(self._jobs_waiter(
+            job_ids, timeout, poll_interval, initial_interval, backoff_factor
+        ))
+    
+    def _jobs_waiter(
+        self,
+        job_ids: List[int],
+        timeout: float,
+        poll_interval: float,
+        initial_interval: float,
+        backoff_factor: float
+    ) -> Generator[float, None, List[JobSchema]]:
+        """
+        Poll jobs until all of them succeed, yielding the delay to sleep before
+        each further poll and returning the jobs in the order of job_ids.
         
-        while remaining_job_ids and time.time() - start_time < timeout:
-            jobs = self.get_jobs(remaining_job_ids)
-            
-            for job in jobs:
-                if job.status == JobStatus.SUCCESS:
-                    completed_jobs.append(job)
-                    remaining_job_ids.remove(job.id)
-                elif job.status in [JobStatus.FAILURE, JobStatus.ERROR]:
-                    failure_reason = None
-                    if hasattr(job, 'response') and isinstance(job.response, dict):
-                        failure_reason = job.response.get('failure_reason')
-                    raise MammothJobFailedError(job.id, failure_reason)
+        Shared by wait_for_jobs and its asyncio counterpart like _job_waiter.
+        """
+        if len(job_ids) == 1:
+            # A single job is cheaper to poll through its own resource
+            job = yield from self._job_waiter(
+                job_ids[0], timeout, poll_interval, initial_interval, backoff_factor
+            )
+            return [job]
+        
+        completed_jobs: Dict[int, JobSchema] = {}
+        remaining_job_ids = set(job_ids)
+        # Query-string form of each ID, built once rather than on every poll
+        id_text = {jid: str(jid) for jid in job_ids}
+        start_time = time.monotonic()
+        delays = _poll_schedule(initial_interval, backoff_factor, poll_interval)
+        
+        while remaining_job_ids and time.monotonic() - start_time < timeout:
+            jobs, to_poll = self._known_states(job_ids, remaining_job_ids, initial_interval)
+            if to_poll:
+                jobs.extend(self._get_jobs([id_text[jid] for jid in to_poll]))
+            self._collect_finished(jobs, completed_jobs, remaining_job_ids)
             
             if remaining_job_ids:
-                time.sleep(poll_interval)
+                delay = next(delays)
+                delay += random.uniform(0, _POLL_JITTER * delay)
+                remaining = timeout - (time.monotonic() - start_time)
+                yield max(0, min(delay, remaining))
         
         if remaining_job_ids:
-            raise MammothJobTimeoutError(remaining_job_ids[0], timeout)
+            first_pending = next(jid for jid in job_ids if jid in remaining_job_ids)
+            raise MammothJobTimeoutError(first_pending, timeout)
             
-        return completed_jobs
+        return [completed_jobs[jid] for jid in job_ids]
+    
+    def _known_states(
+        self,
+        job_ids: List[int],
+        pending: Set[int],
+        max_age: float
+    ) -> Tuple[List[JobSchema], List[int]]:
+        """
+        Split pending jobs into those whose remembered state can be reused and
+        those to poll.
+        
+        Jobs already seen in a final state, or fetched less than max_age
+        seconds ago (e.g. by another waiter), are not re-requested. Both lists
+        keep the order of job_ids.
+        """
+        known = []
+        to_poll = []
+        now = time.monotonic()
+        with self._status_lock:
+            for jid in job_ids:
+                if jid not in pending:
+                    continue
+                entry = self._status_cache.get(jid)
+                if entry is not None and (
+                    entry[0].status in _TERMINAL_STATUSES or now - entry[1] < max_age
+                ):
+                    known.append(entry[0])
+                else:
+                    to_poll.append(jid)
+        return known, to_poll
+    
+    @staticmethod
+    def _collect_finished(
+        jobs: List[JobSchema],
+        completed: Dict[int, JobSchema],
+        pending: Set[int]
+    ) -> None:
+        """
+        Move succeeded jobs from pending to completed.
+        
+        Raises:
+            MammothJobFailedError: If any of the jobs failed
+        """
+        for job in jobs:
+            if job.status == JobStatus.SUCCESS:
+                completed[job.id] = job
+                pending.discard(job.id)
+            elif job.status in _FAILED_STATUSES:
+                raise MammothJobFailedError(job.id, job.response.get('failure_reason'))
     
     def extract_dataset_ids(self, jobs: List[JobSchema]) -> List[Optional[int]]:
         """
@@ -146,12 +467,18 @@ class JobsAPI:
         Returns:
             List of dataset IDs (None if not found in response)
         """
-        dataset_ids = []
-        for job in jobs:
-            ds_id = None
-            if (hasattr(job, 'response') and 
-                isinstance(job.response, dict) and 
-                'ds_id' in job.response):
-                ds_id = job.response['ds_id']
-            dataset_ids.append(ds_id)
-        return dataset_ids
+        return [job.response.get('ds_id') for job in jobs]
+    
+    def extract_dataset_ids_from_raw(self, raw_jobs: List[Dict[str, Any]]) -> List[Optional[int]]:
+        """
+        Extract dataset IDs from raw job objects, as returned by the /jobs endpoint.
+        
+        Skips building JobSchema models when only the dataset IDs are needed.
+        
+        Args:
+            raw_jobs: List of job dictionaries, each with a "response" mapping
+            
+        Returns:
+            List of dataset IDs (None if not found in response)
+        """
+        return [(job.get('response') or {}).get('ds_id') for job in raw_jobs]
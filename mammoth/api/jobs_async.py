@@ -0,0 +1,74 @@
+"""
+Asyncio interface to the Mammoth Jobs API.
+"""
+
+import asyncio
+from typing import Any, Generator, List
+
+from ..models.jobs import JobSchema
+from .jobs import JobsAPI, _advance
+
+
+async def _drive(waiter: Generator[float, None, Any]) -> Any:
+    """Drive a JobsAPI waiter, polling in a worker thread and sleeping on the event loop."""
+    while True:
+        finished, value = await asyncio.to_thread(_advance, waiter)
+        if finished:
+            return value
+        await asyncio.sleep(value)
+
+
+class AsyncJobsAPI:
+    """
+    Coroutine versions of the JobsAPI methods.
+
+    Requests run in worker threads on the client's connection pool, while the
+    waits between polls are asyncio sleeps, so many jobs can be awaited with
+    asyncio.gather without holding a thread per job. Remembered job states are
+    shared with the synchronous client.jobs.
+    """
+
+    def __init__(self, jobs: JobsAPI):
+        self._jobs = jobs
+
+    async def get_job(self, job_id: int) -> JobSchema:
+        """Async version of JobsAPI.get_job."""
+        return await asyncio.to_thread(self._jobs.get_job, job_id)
+
+    async def get_jobs(self, job_ids: List[int]) -> List[JobSchema]:
+        """Async version of JobsAPI.get_jobs."""
+        return await asyncio.to_thread(self._jobs.get_jobs, job_ids)
+
+    async def wait_for_job(
+        self,
+        job_id: int,
+        timeout: int = 300,
+        poll_interval: int = 5,
+        initial_interval: float = 0.2,
+        backoff_factor: float = 2.0
+    ) -> JobSchema:
+        """
+        Async version of JobsAPI.wait_for_job.
+
+        Arguments, return value and exceptions are the same as wait_for_job.
+        """
+        return await _drive(self._jobs._job_waiter(
+            job_id, timeout, poll_interval, initial_interval, backoff_factor
+        ))
+
+    async def wait_for_jobs(
+        self,
+        job_ids: List[int],
+        timeout: int = 300,
+        poll_interval: int = 5,
+        initial_interval: float = 0.2,
+        backoff_factor: float = 2.0
+    ) -> List[JobSchema]:
+        """
+        Async version of JobsAPI.wait_for_jobs.
+
+        Arguments, return value and exceptions are the same as wait_for_jobs.
+        """
+        return await _drive(self._jobs._jobs_waiter(
+            job_ids, timeout, poll_interval, initial_interval, backoff_factor
+        ))
@@ -2,15 +2,43 @@
 Main client for the Mammoth Analytics SDK.
 """
 
+import time
 import requests
-from typing import Optional, Dict, Any, Union, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, Union, List, Mapping, Tuple
 from urllib.parse import urljoin
 
 from .api.exports import ExportsAPI
+from .api._cache import ResponseCache
 
 from .exceptions import MammothAPIError, MammothAuthError
 from .api.files import FilesAPI
 from .api.jobs import JobsAPI
+from .api.jobs_async import AsyncJobsAPI
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to the stdlib json module
+    orjson = None
+
+# Minimum connections kept alive per host. Sized above requests' default of 10
+# so concurrent uploads, polls and presigned-URL downloads from worker threads
+# don't evict each other; raised further when max_parallel is larger.
+_POOL_MAXSIZE = 32
+
+# Gateway errors that are worth retrying after a short backoff
+_RETRY_STATUSES = (502, 503, 504)
+# Response validators stored with cached reads, mapped to the conditional
+# request header that revalidates them
+_VALIDATOR_HEADERS = {'ETag': 'If-None-Match', 'Last-Modified': 'If-Modified-Since'}
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
 
 class MammothClient:
@@ -41,7 +69,9 @@ class MammothClient:
         api_secret: str,
         base_url: str = "https://app.mammoth.io/api/v2",
         timeout: int = 30,
-        max_retries: int = 3
+        max_retries: int = 3,
+        cache_ttl: float = 30.0,
+        max_parallel: int = 8
     ):
         """
         Initialize the Mammoth client.
@@ -52,16 +82,28 @@ class MammothClient:
             base_url: Base URL for the Mammoth API (default: https://api.mammoth.io)
             timeout: Request timeout in seconds (default: 30)
             max_retries: Maximum number of retries for failed requests (default: 3)
+            cache_ttl: Seconds a cached read stays fresh when a call opts into
+                the response cache (default: 30)
+            max_parallel: Maximum number of requests a single SDK call issues
+                concurrently, e.g. get_jobs for long ID lists (default: 8)
+                
+        Raises:
+            ValueError: If max_parallel is less than 1
         """
+        if max_parallel < 1:
+            raise ValueError(f"max_parallel must be at least 1, got {max_parallel}")
+        
         self.api_key = api_key
         self.api_secret = api_secret
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.max_retries = max_retries
+        self.max_parallel = max_parallel
         
         # Ensure base URL includes API version path
         if not self.base_url.endswith('/api/v2'):
             self.base_url = urljoin(self.base_url, '/api/v2')
+        self._url_prefix = self.base_url + '/'
         
         # Initialize session with authentication headers
         self.session = requests.Session()
@@ -71,11 +113,40 @@ class MammothClient:
             'User-Agent': 'mammoth-python-sdk/0.1.0'
         })
         
+        # Pool connections per host so every call reuses an open TLS connection.
+        # Connection errors and timeouts are retried by _request; the adapter
+        # only retries idempotent requests answered with a gateway error.
+        retry = Retry(
+            total=max_retries,
+            connect=False,
+            read=False,
+            status_forcelist=_RETRY_STATUSES,
+            backoff_factor=0.3,
+            raise_on_status=False
+        )
+        pool_size = max(_POOL_MAXSIZE, max_parallel)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Opt-in cache for idempotent reads (see the `cache` argument on list calls)
+        self._cache = ResponseCache(ttl=cache_ttl)
+        
         # Initialize API clients
         self.files = FilesAPI(self)
         self.jobs = JobsAPI(self)
+        self.jobs_async = AsyncJobsAPI(self.jobs)
         self.exports = ExportsAPI(self)
     
+    @property
+    def cache(self) -> ResponseCache:
+        """Response cache used by reads that pass cache=True."""
+        return self._cache
+    
     def _request(
         self,
         method: str,
@@ -83,8 +154,11 @@ class MammothClient:
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
         files: Optional[List] = None,
+        use_cache: bool = False,
+        with_headers: bool = False,
+        raw: bool = False,
         **kwargs
-    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]], bytes, Tuple[Any, Mapping[str, str]]]:
         """
         Make an authenticated request to the Mammoth API.
         
@@ -94,16 +168,39 @@ class MammothClient:
             params: Query parameters
             json: JSON body for the request
             files: Files for multipart upload
+            use_cache: Serve a GET from the response cache when possible and
+                store its result. Expired entries with an ETag or Last-Modified
+                header are revalidated with a conditional request, and a 304
+                reply reuses the cached body. Writes always invalidate cached
+                reads of the resource they touch.
+            with_headers: Return a (body, response headers) tuple instead of
+                the body alone. Headers are empty when served from the cache.
+            raw: Return the undecoded response body as bytes, for callers that
+                parse it themselves (e.g. pydantic's model_validate_json).
+                Raw responses bypass the response cache.
             **kwargs: Additional arguments passed to requests
             
         Returns:
-            Parsed JSON response
+            Parsed JSON response (bytes if raw is set), or (response, headers)
+            if with_headers is set
             
         Raises:
             MammothAuthError: If authentication fails
             MammothAPIError: If the API returns an error
         """
-        url = urljoin(self.base_url + '/', endpoint.lstrip('/'))
+        url = self._url_prefix + endpoint.lstrip('/')
+        
+        cache_key = None
+        stale = None
+        if method.upper() == "GET":
+            if use_cache and not raw:
+                cache_key = self._cache.make_key(endpoint, params)
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    return (cached, {}) if with_headers else cached
+                stale = self._cache.get_stale(cache_key)
+        else:
+            self._cache.invalidate_resource(endpoint)
         
         # Prepare request arguments
         request_kwargs = {
@@ -111,6 +208,12 @@ class MammothClient:
             **kwargs
         }
         
+        if stale is not None:
+            request_kwargs['headers'] = {
+                **request_kwargs.get('headers', {}),
+                **{_VALIDATOR_HEADERS[name]: value for name, value in stale[1].items()}
+            }
+        
         if params:
             request_kwargs['params'] = params
         
@@ -118,42 +221,67 @@ class MammothClient:
             # Remove Content-Type header for multipart requests
             request_kwargs['files'] = files
         elif json:
-            headers = self.session.headers.copy()
-            request_kwargs['headers'] = headers
-            headers['Content-Type'] = 'application/json'
-            request_kwargs['json'] = json
+            # requests merges per-request headers over the session's own
+            request_kwargs['headers'] = {
+                **request_kwargs.get('headers', {}),
+                'Content-Type': 'application/json'
+            }
+            if orjson is not None:
+                request_kwargs['data'] = orjson.dumps(json, option=orjson.OPT_NON_STR_KEYS)
+            else:
+                request_kwargs['json'] = json
         
         # Make request with retries
         last_exception = None
         for attempt in range(self.max_retries + 1):
             try:
+                # Rewind streamed bodies so a retry resends them from the start
+                if attempt and hasattr(request_kwargs.get('data'), 'seek'):
+                    request_kwargs['data'].seek(0)
                 response = self.session.request(method, url, **request_kwargs)
                 
                 # Handle authentication errors
                 if response.status_code == 401:
                     raise MammothAuthError("Invalid API credentials")
                 
+                # The cached copy is still current
+                if response.status_code == 304 and stale is not None:
+                    self._cache.set(cache_key, *stale)
+                    return (stale[0], response.headers) if with_headers else stale[0]
+                
                 # Handle successful responses (200-299)
                 if 200 <= response.status_code < 300:
-                    # Handle empty responses (like DELETE operations)
-                    if response.status_code == 204 or not response.content:
-                        return {}
-                    
-                    try:
-                        return response.json()
-                    except ValueError as e:
-                        raise MammothAPIError(
-                            f"Invalid JSON response: {str(e)}",
-                            status_code=response.status_code,
-                            response_body=response.text
-                        )
+                    if raw:
+                        body = response.content
+                    elif response.status_code == 204 or not response.content:
+                        # Empty responses (like DELETE operations)
+                        body = {}
+                    else:
+                        try:
+                            body = _decode_json(response)
+                        except ValueError as e:
+                            raise MammothAPIError(
+                                f"Invalid JSON response: {str(e)}",
+                                status_code=response.status_code,
+                                response_body=response.text
+                            )
+                        
+                        if cache_key is not None:
+                            validators = {
+                                name: response.headers[name]
+                                for name in _VALIDATOR_HEADERS
+                                if name in response.headers
+                            }
+                            self._cache.set(cache_key, body, validators)
+                    return (body, response.headers) if with_headers else body
+
                 
                 # Handle client and server errors
                 error_detail = "Unknown error"
                 response_data = {}
                 
                 try:
-                    response_data = response.json()
+                    response_data = _decode_json(response)
                     if isinstance(response_data, dict):
                         error_detail = response_data.get('detail', f"HTTP {response.status_code}")
                     else:
@@ -179,7 +307,6 @@ class MammothClient:
             
             # If this isn't the last attempt, wait before retrying
             if attempt < self.max_retries:
-                import time
                 time.sleep(2 ** attempt)  # Exponential backoff
         
         # If all retries failed, raise the last exception
@@ -207,11 +334,23 @@ class MammothClient:
         except Exception:
             return False
     
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        if self.session:
+            self.session.close()
+    
     def __enter__(self):
         """Context manager entry."""
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        if self.session:
-            self.session.close()
+        self.close()
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        self.__exit__(exc_type, exc_val, exc_tb)
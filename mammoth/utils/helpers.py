@@ -2,10 +2,28 @@
 Helper functions for the Mammoth Analytics SDK.
 """
 
+import errno
 import os
+import stat
+from functools import lru_cache
 from pathlib import Path
-from typing import Union, List
-from datetime import datetime
+from typing import Union, List, Optional
+from datetime import datetime, tzinfo
+
+# stat() errors that mean the path doesn't lead to a file, as in Path.exists()
+_MISSING_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP})
+
+
+@lru_cache(maxsize=1024)
+def _format_datetime(dt: datetime, tz: Optional[tzinfo], fold: int) -> str:
+    """
+    Format a datetime for API queries, naive datetimes being treated as UTC.
+    
+    The time zone and fold are part of the cache key because datetimes that
+    differ only in those compare (and hash) equal but can format with a
+    different UTC offset, e.g. in a DST fall-back hour.
+    """
+    return dt.isoformat() + ('Z' if tz is None else '')
 
 
 def format_date_range(from_date: datetime, to_date: datetime) -> str:
@@ -19,8 +37,8 @@ def format_date_range(from_date: datetime, to_date: datetime) -> str:
     Returns:
         Formatted date range string for API
     """
-    from_str = from_date.isoformat() + 'Z' if not from_date.tzinfo else from_date.isoformat()
-    to_str = to_date.isoformat() + 'Z' if not to_date.tzinfo else to_date.isoformat()
+    from_str = _format_datetime(from_date, from_date.tzinfo, from_date.fold)
+    to_str = _format_datetime(to_date, to_date.tzinfo, to_date.fold)
     return f"(from:'{from_str}',to:'{to_str}')"
 
 
@@ -38,15 +56,25 @@ def validate_file_path(file_path: Union[str, Path]) -> Path:
         FileNotFoundError: If file doesn't exist
         ValueError: If path is not a file
     """
-    path = Path(file_path)
+    # Work on the plain string and only build a Path for a valid file
+    path = os.fspath(file_path)
     
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {path}")
+    # One stat() answers both checks
+    try:
+        mode = os.stat(path).st_mode
+    except ValueError:
+        # Invalid path, e.g. one containing a NUL byte
+        raise FileNotFoundError(f"File not found: {path}") from None
+    except OSError as e:
+        # Other errors, such as PermissionError, are not a missing file
+        if e.errno not in _MISSING_ERRNOS:
+            raise
+        raise FileNotFoundError(f"File not found: {path}") from None
     
-    if not path.is_file():
+    if not stat.S_ISREG(mode):
         raise ValueError(f"Path is not a file: {path}")
     
-    return path
+    return file_path if isinstance(file_path, Path) else Path(path)
 
 
 def parse_job_ids(job_ids_str: str) -> List[int]:
@@ -62,11 +90,14 @@ def parse_job_ids(job_ids_str: str) -> List[int]:
     Raises:
         ValueError: If any job ID is not a valid integer
     """
-    if not job_ids_str.strip():
+    if not job_ids_str or job_ids_str.isspace():
         return []
     
     try:
-        return [int(job_id.strip()) for job_id in job_ids_str.split(',')]
+        if ',' not in job_ids_str:
+            return [int(job_ids_str)]
+        # int() ignores surrounding whitespace, so tokens need no strip()
+        return list(map(int, job_ids_str.split(',')))
     except ValueError as e:
         raise ValueError(f"Invalid job ID format: {e}")
 
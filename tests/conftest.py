@@ -0,0 +1,104 @@
+"""
+Shared fixtures: a MammothClient whose HTTP traffic goes to an in-process handler.
+"""
+
+import json
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+import mammoth.client
+from mammoth.client import MammothClient
+
+BASE_URL = "https://api.example.test/api/v2"
+
+
+class FakeAdapter(BaseAdapter):
+    """
+    Transport adapter that hands each request to a handler instead of the network.
+
+    The handler receives the prepared request and its body as bytes (streamed
+    bodies are read in full first) and returns a (status, body, headers)
+    tuple, or raises a requests exception to simulate a transport failure.
+    """
+
+    def __init__(self, handler: Callable[[requests.PreparedRequest, bytes], Tuple]):
+        super().__init__()
+        self.handler = handler
+        self.requests: List[Tuple[requests.PreparedRequest, bytes]] = []
+
+    def send(self, request, **kwargs):
+        body = request.body
+        if body is None:
+            body = b""
+        elif isinstance(body, str):
+            body = body.encode()
+        elif not isinstance(body, bytes):
+            body = b"".join(body)
+        self.requests.append((request, body))
+
+        status, payload, headers = self.handler(request, body)
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers or {})
+        if isinstance(payload, bytes):
+            response._content = payload
+        elif payload is None:
+            response._content = b""
+        else:
+            response._content = json.dumps(payload).encode()
+            response.headers.setdefault("Content-Type", "application/json")
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+def request_path(request: requests.PreparedRequest) -> str:
+    """Return the request path relative to the API base, e.g. /jobs/5."""
+    return urlsplit(request.url).path[len("/api/v2"):]
+
+
+def request_query(request: requests.PreparedRequest) -> Dict[str, List[str]]:
+    return parse_qs(urlsplit(request.url).query)
+
+
+def job(job_id: int, status: str = "success", response: Optional[Dict[str, Any]] = None,
+        operation: str = "upload") -> Dict[str, Any]:
+    """A job object as returned by the /jobs endpoints."""
+    return {
+        "id": job_id,
+        "status": status,
+        "response": {"ds_id": job_id * 10} if response is None else response,
+        "last_updated_at": "2024-01-01T00:00:00",
+        "created_at": "2024-01-01T00:00:00",
+        "path": "/x",
+        "operation": operation,
+    }
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    """
+    Build a client routed through a FakeAdapter.
+
+    Returns a factory taking the handler and MammothClient keyword arguments;
+    the adapter is available as client.adapter. Retry backoff doesn't sleep.
+    """
+    monkeypatch.setattr(mammoth.client, "time", SimpleNamespace(sleep=lambda seconds: None))
+
+    def factory(handler, **kwargs) -> MammothClient:
+        client = MammothClient("key", "secret", base_url=BASE_URL, **kwargs)
+        adapter = FakeAdapter(handler)
+        client.session.mount("https://", adapter)
+        client.adapter = adapter
+        return client
+
+    return factory
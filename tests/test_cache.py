@@ -0,0 +1,156 @@
+"""
+Tests for the response cache and conditional GETs in MammothClient._request.
+"""
+
+from mammoth.api._cache import ResponseCache
+
+from conftest import request_path
+
+FILES = "/workspaces/1/projects/2/files"
+
+
+def test_fresh_entry_is_served_without_a_request(make_client):
+    calls = []
+
+    def handler(request, body):
+        calls.append(request)
+        return 200, {"files": [len(calls)]}, {}
+
+    client = make_client(handler, cache_ttl=60)
+
+    first = client._request("GET", FILES, params={"limit": 5}, use_cache=True)
+    second = client._request("GET", FILES, params={"limit": 5}, use_cache=True)
+    other = client._request("GET", FILES, params={"limit": 6}, use_cache=True)
+    uncached = client._request("GET", FILES, params={"limit": 5})
+
+    assert first == second == {"files": [1]}
+    assert other == {"files": [2]}
+    assert uncached == {"files": [3]}
+    assert len(calls) == 3
+
+
+def test_expired_entry_is_revalidated_with_etag_and_reused_on_304(make_client):
+    sent_headers = []
+
+    def handler(request, body):
+        sent_headers.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return 304, None, {"ETag": '"v1"'}
+        return 200, {"files": ["a"]}, {"ETag": '"v1"'}
+
+    # A zero TTL makes every entry stale at once, so each read revalidates
+    client = make_client(handler, cache_ttl=0)
+
+    assert client._request("GET", FILES, use_cache=True) == {"files": ["a"]}
+    assert client._request("GET", FILES, use_cache=True) == {"files": ["a"]}
+    assert "If-None-Match" not in sent_headers[0]
+    assert sent_headers[1]["If-None-Match"] == '"v1"'
+
+
+def test_last_modified_is_sent_as_if_modified_since(make_client):
+    stamp = "Wed, 01 Jan 2025 00:00:00 GMT"
+    responses = iter([
+        (200, {"files": ["old"]}, {"Last-Modified": stamp}),
+        (200, {"files": ["new"]}, {"Last-Modified": stamp}),
+    ])
+    sent_headers = []
+
+    def handler(request, body):
+        sent_headers.append(dict(request.headers))
+        return next(responses)
+
+    client = make_client(handler, cache_ttl=0)
+
+    client._request("GET", FILES, use_cache=True)
+    assert client._request("GET", FILES, use_cache=True) == {"files": ["new"]}
+    assert sent_headers[1]["If-Modified-Since"] == stamp
+
+
+def test_expired_entry_without_validators_is_refetched(make_client):
+    calls = []
+
+    def handler(request, body):
+        calls.append(request)
+        return 200, {"n": len(calls)}, {}
+
+    client = make_client(handler, cache_ttl=0)
+
+    assert client._request("GET", FILES, use_cache=True) == {"n": 1}
+    assert client._request("GET", FILES, use_cache=True) == {"n": 2}
+    assert all("If-None-Match" not in request.headers for request in calls)
+
+
+def test_mutating_call_invalidates_its_collection(make_client):
+    calls = []
+
+    def handler(request, body):
+        calls.append((request.method, request_path(request)))
+        return 200, {"n": len(calls)}, {}
+
+    client = make_client(handler, cache_ttl=60)
+    other_project = "/workspaces/1/projects/3/files"
+
+    client._request("GET", FILES, use_cache=True)
+    client._request("GET", FILES + "/5", use_cache=True)
+    client._request("GET", other_project, use_cache=True)
+    client._request("DELETE", FILES + "/5")
+    client._request("GET", FILES, use_cache=True)
+    client._request("GET", FILES + "/5", use_cache=True)
+    client._request("GET", other_project, use_cache=True)
+
+    assert calls == [
+        ("GET", FILES),
+        ("GET", FILES + "/5"),
+        ("GET", other_project),
+        ("DELETE", FILES + "/5"),
+        ("GET", FILES),
+        ("GET", FILES + "/5"),
+    ]
+
+
+def test_explicit_invalidate_by_prefix(make_client):
+    calls = []
+
+    def handler(request, body):
+        calls.append(request)
+        return 200, {}, {}
+
+    client = make_client(handler, cache_ttl=60)
+    client._request("GET", FILES, use_cache=True)
+    client.cache.invalidate("/workspaces/1")
+    client._request("GET", FILES, use_cache=True)
+
+    assert len(calls) == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(maxsize=2, ttl=60)
+    keys = [ResponseCache.make_key(f"/files/{i}") for i in range(3)]
+
+    cache.set(keys[0], "zero")
+    cache.set(keys[1], "one")
+    assert cache.get(keys[0]) == "zero"
+    cache.set(keys[2], "two")
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == "zero"
+    assert cache.get(keys[2]) == "two"
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("mammoth.api._cache.time.monotonic", lambda: now[0])
+    cache = ResponseCache(ttl=30)
+    plain = ResponseCache.make_key("/files")
+    validated = ResponseCache.make_key("/files", {"limit": 1})
+
+    cache.set(plain, "body")
+    cache.set(validated, "body", {"ETag": '"x"'})
+    now[0] += 29
+    assert cache.get(plain) == "body"
+    now[0] += 2
+
+    assert cache.get(plain) is None
+    assert cache.get_stale(plain) is None
+    assert cache.get(validated) is None
+    assert cache.get_stale(validated) == ("body", {"ETag": '"x"'})
@@ -0,0 +1,34 @@
+"""
+Tests for MammothClient construction.
+"""
+
+import socket
+
+import pytest
+
+from mammoth.client import MammothClient
+from mammoth.exceptions import MammothAPIError
+
+
+@pytest.mark.parametrize("max_parallel", [0, -1])
+def test_max_parallel_must_be_positive(max_parallel):
+    with pytest.raises(ValueError, match="max_parallel"):
+        MammothClient("key", "secret", max_parallel=max_parallel)
+
+
+def test_max_parallel_sizes_the_connection_pool():
+    client = MammothClient("key", "secret", max_parallel=64)
+    assert client.max_parallel == 64
+    assert client.session.get_adapter("https://app.mammoth.io")._pool_maxsize == 64
+
+
+def test_read_timeout_is_reported_as_timeout():
+    # A server that accepts connections but never answers
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen(4)
+        base_url = "http://127.0.0.1:{}".format(server.getsockname()[1])
+        client = MammothClient("key", "secret", base_url=base_url, timeout=0.2, max_retries=0)
+
+        with pytest.raises(MammothAPIError, match="^Request timeout"):
+            client._request("GET", "/jobs")
@@ -0,0 +1,57 @@
+"""
+Tests for mammoth.api.files.
+"""
+
+import io
+import json
+import os
+import tempfile
+
+import requests
+
+from mammoth.api.files import _upload_name
+from mammoth.client import MammothClient
+
+
+def _response(status, body):
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body).encode()
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+def test_upload_name_uses_basename_of_path_and_name_attribute():
+    assert _upload_name("/data/in/sales.csv") == "sales.csv"
+    named = io.BytesIO(b"x")
+    named.name = "/tmp/report.csv"
+    assert _upload_name(named) == "report.csv"
+    assert _upload_name(io.BytesIO(b"x")) == "uploaded_file"
+
+
+def test_upload_name_falls_back_for_fd_backed_files():
+    read_fd, write_fd = os.pipe()
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as pipe, tempfile.TemporaryFile() as temp:
+        assert _upload_name(pipe) == "uploaded_file"
+        assert _upload_name(temp) == "uploaded_file"
+
+
+def test_upload_files_accepts_pipe(monkeypatch):
+    client = MammothClient("key", "secret", base_url="https://api.example.test")
+    sent = []
+
+    def fake_request(method, url, **kwargs):
+        sent.append(kwargs)
+        return _response(200, [{"job_id": 7}])
+
+    monkeypatch.setattr(client.session, "request", fake_request)
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"a,b\n1,2\n")
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as pipe:
+        job_ids = client.files.upload_files(1, 2, pipe, wait_for_completion=False)
+
+    assert job_ids == [7]
+    name, body, _ = sent[0]["files"][0][1]
+    assert name == "uploaded_file"
@@ -0,0 +1,71 @@
+"""
+Tests for mammoth.utils.helpers.
+"""
+
+import errno
+import os
+from datetime import datetime, timedelta, tzinfo
+
+import pytest
+
+from mammoth.utils import format_date_range, validate_file_path
+
+
+class _FallBack(tzinfo):
+    """Zone whose offset depends only on fold, like a DST fall-back hour."""
+
+    def utcoffset(self, dt):
+        return timedelta(hours=-5 if dt.fold else -4)
+
+    def dst(self, dt):
+        return timedelta(0)
+
+
+def test_format_date_range_naive_gets_utc_suffix():
+    start = datetime(2024, 1, 1)
+    end = datetime(2024, 1, 2, 12, 30)
+    assert format_date_range(start, end) == (
+        "(from:'2024-01-01T00:00:00Z',to:'2024-01-02T12:30:00Z')"
+    )
+
+
+def test_format_date_range_distinguishes_fold():
+    tz = _FallBack()
+    first = datetime(2024, 11, 3, 1, 30, tzinfo=tz)
+    second = first.replace(fold=1)
+    assert first == second
+    assert format_date_range(first, second) == (
+        "(from:'2024-11-03T01:30:00-04:00',to:'2024-11-03T01:30:00-05:00')"
+    )
+    assert format_date_range(second, first) == (
+        "(from:'2024-11-03T01:30:00-05:00',to:'2024-11-03T01:30:00-04:00')"
+    )
+
+
+def test_validate_file_path_accepts_regular_file(tmp_path):
+    target = tmp_path / "data.csv"
+    target.write_text("a,b\n")
+    assert validate_file_path(str(target)) == target
+    assert validate_file_path(target) is target
+
+
+@pytest.mark.parametrize("name", ["missing.csv", "loop", "bad\0name"])
+def test_validate_file_path_reports_unusable_paths_as_missing(tmp_path, name):
+    loop = tmp_path / "loop"
+    loop.symlink_to(loop)
+    with pytest.raises(FileNotFoundError):
+        validate_file_path(str(tmp_path / name))
+
+
+def test_validate_file_path_rejects_directory(tmp_path):
+    with pytest.raises(ValueError):
+        validate_file_path(tmp_path)
+
+
+def test_validate_file_path_keeps_permission_errors(tmp_path, monkeypatch):
+    def denied(path, *args, **kwargs):
+        raise PermissionError(errno.EACCES, "Permission denied", path)
+
+    monkeypatch.setattr(os, "stat", denied)
+    with pytest.raises(PermissionError):
+        validate_file_path(str(tmp_path / "data.csv"))
@@ -0,0 +1,213 @@
+"""
+Tests for job polling in JobsAPI and AsyncJobsAPI.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import mammoth.api.jobs
+from mammoth.exceptions import MammothJobFailedError, MammothJobTimeoutError
+
+from conftest import job, request_path, request_query
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Virtual time for the synchronous waiters; sleeping advances it instantly."""
+    state = SimpleNamespace(now=1000.0, sleeps=[])
+
+    def sleep(seconds):
+        state.sleeps.append(seconds)
+        state.now += seconds
+
+    monkeypatch.setattr(mammoth.api.jobs, "time", SimpleNamespace(
+        monotonic=lambda: state.now,
+        time=lambda: state.now,
+        sleep=sleep,
+    ))
+    return state
+
+
+def _single_job_server(statuses, headers=None, extra=None):
+    """Answer /jobs/{id} with the given statuses in turn, repeating the last one."""
+    polls = []
+
+    def handler(request, body):
+        job_id = int(request_path(request).rsplit("/", 1)[1])
+        polls.append(job_id)
+        status = statuses[min(len(polls), len(statuses)) - 1]
+        payload = {"job": job(job_id, status)}
+        payload.update(extra or {})
+        return 200, payload, headers or {}
+
+    return handler, polls
+
+
+def test_wait_for_job_backs_off_until_timeout(make_client, clock):
+    handler, polls = _single_job_server(["processing"])
+    client = make_client(handler)
+
+    with pytest.raises(MammothJobTimeoutError) as error:
+        client.jobs.wait_for_job(5, timeout=10, poll_interval=2, initial_interval=0.25)
+
+    assert error.value.details == {"job_id": 5, "timeout": 10}
+    assert sum(clock.sleeps) == pytest.approx(10)
+    assert 0.25 <= clock.sleeps[0] <= 0.25 * 1.1
+    assert 0.5 <= clock.sleeps[1] <= 0.5 * 1.1
+    assert all(delay <= 2 * 1.1 for delay in clock.sleeps)
+    assert len(polls) == len(clock.sleeps)
+
+
+def test_wait_for_job_honours_retry_after_header(make_client, clock):
+    handler, polls = _single_job_server(["processing", "success"], headers={"Retry-After": "7"})
+    client = make_client(handler)
+
+    result = client.jobs.wait_for_job(5)
+
+    assert result.id == 5
+    assert clock.sleeps == [7.0]
+
+
+def test_wait_for_job_honours_retry_after_ms_body_field(make_client, clock):
+    handler, polls = _single_job_server(["processing", "success"], extra={"retry_after_ms": 1500})
+    client = make_client(handler)
+
+    client.jobs.wait_for_job(5)
+
+    assert clock.sleeps == [1.5]
+
+
+def test_wait_for_job_raises_on_failure(make_client, clock):
+    handler, polls = _single_job_server(["processing", "failure"])
+    client = make_client(handler)
+
+    with pytest.raises(MammothJobFailedError):
+        client.jobs.wait_for_job(5)
+
+
+def test_wait_for_job_rejects_invalid_schedule(make_client, clock):
+    client = make_client(lambda request, body: pytest.fail("no request expected"))
+
+    with pytest.raises(ValueError):
+        client.jobs.wait_for_job(5, initial_interval=0)
+
+
+def test_finished_job_is_not_fetched_again(make_client, clock):
+    handler, polls = _single_job_server(["success"])
+    client = make_client(handler)
+
+    client.jobs.wait_for_job(5)
+    assert client.jobs.get_job(5).id == 5
+    assert polls == [5]
+
+    client.jobs.invalidate(5)
+    client.jobs.get_job(5)
+    assert polls == [5, 5]
+
+
+def test_learned_duration_lengthens_first_delay(make_client, clock):
+    statuses = {}
+
+    def handler(request, body):
+        job_id = int(request_path(request).rsplit("/", 1)[1])
+        statuses[job_id] = statuses.get(job_id, 0) + 1
+        payload = job(job_id, "processing" if statuses[job_id] == 1 else "success")
+        if statuses[job_id] > 1:
+            payload["last_updated_at"] = "2024-01-01T00:00:08"
+        return 200, {"job": payload}, {}
+
+    client = make_client(handler)
+    client.jobs.wait_for_job(1)
+    clock.sleeps.clear()
+
+    client.jobs.wait_for_job(2)
+
+    # A quarter of the 8 s the first upload took, plus jitter
+    assert 2.0 <= clock.sleeps[0] <= 2.2
+
+
+def _batch_server(finish_round):
+    """Answer /jobs?job_ids=... ; job i succeeds from poll round finish_round[i] on."""
+    rounds = []
+
+    def handler(request, body):
+        ids = [int(jid) for jid in request_query(request)["job_ids"][0].split(",")]
+        rounds.append(ids)
+        jobs = [
+            job(jid, "success" if len(rounds) >= finish_round[jid] else "processing")
+            for jid in sorted(ids)
+        ]
+        return 200, {"jobs": jobs}, {}
+
+    return handler, rounds
+
+
+def test_wait_for_jobs_returns_jobs_in_requested_order(make_client, clock):
+    handler, rounds = _batch_server({10: 1, 20: 2, 30: 3})
+    client = make_client(handler)
+
+    results = client.jobs.wait_for_jobs([30, 10, 20])
+
+    assert [result.id for result in results] == [30, 10, 20]
+    assert rounds == [[30, 10, 20], [30, 20], [30]]
+
+
+def test_wait_for_jobs_reports_first_pending_job_on_timeout(make_client, clock):
+    handler, rounds = _batch_server({10: 1, 20: 99, 30: 99})
+    client = make_client(handler)
+
+    with pytest.raises(MammothJobTimeoutError) as error:
+        client.jobs.wait_for_jobs([30, 10, 20], timeout=3)
+
+    assert error.value.details["job_id"] == 30
+    assert sum(clock.sleeps) == pytest.approx(3)
+
+
+def test_wait_for_jobs_with_one_id_polls_the_job_resource(make_client, clock):
+    handler, polls = _single_job_server(["success"])
+    client = make_client(handler)
+
+    results = client.jobs.wait_for_jobs([7])
+
+    assert [result.id for result in results] == [7]
+    assert polls == [7]
+
+
+def test_async_waiters_with_gather(make_client):
+    seen = {}
+
+    def per_job(request, body):
+        job_id = int(request_path(request).rsplit("/", 1)[1])
+        seen[job_id] = seen.get(job_id, 0) + 1
+        status = "success" if seen[job_id] > 1 else "processing"
+        return 200, {"job": job(job_id, status)}, {}
+
+    client = make_client(per_job)
+
+    async def wait_all():
+        return await asyncio.gather(*(
+            client.jobs_async.wait_for_job(job_id, initial_interval=0.01)
+            for job_id in range(1, 6)
+        ))
+
+    results = asyncio.run(wait_all())
+
+    assert [result.id for result in results] == [1, 2, 3, 4, 5]
+    assert seen == {job_id: 2 for job_id in range(1, 6)}
+
+
+def test_async_wait_for_jobs_order_and_timeout(make_client):
+    handler, rounds = _batch_server({10: 1, 20: 2, 30: 2})
+    client = make_client(handler)
+
+    results = asyncio.run(client.jobs_async.wait_for_jobs([30, 10, 20], initial_interval=0.01))
+    assert [result.id for result in results] == [30, 10, 20]
+
+    never, _ = _batch_server({1: 99, 2: 99})
+    client = make_client(never)
+    with pytest.raises(MammothJobTimeoutError):
+        asyncio.run(client.jobs_async.wait_for_jobs(
+            [1, 2], timeout=0.05, initial_interval=0.01
+        ))
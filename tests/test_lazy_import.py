@@ -0,0 +1,40 @@
+"""
+Tests for lazy attribute access on the mammoth package.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _run(code: str) -> None:
+    # A fresh interpreter, so no submodule has been imported yet
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parent.parent)
+
+
+@pytest.mark.parametrize("name", ["models", "api", "client", "utils", "exceptions"])
+def test_submodule_access_after_plain_import(name):
+    _run(f"import mammoth, types; assert isinstance(mammoth.{name}, types.ModuleType)")
+
+
+def test_models_then_api():
+    _run("import mammoth; mammoth.models; mammoth.api")
+
+
+def test_lazy_names_resolve_and_are_cached():
+    _run(
+        "import mammoth\n"
+        "client = mammoth.MammothClient\n"
+        "assert client is mammoth.client.MammothClient\n"
+        "assert 'MammothClient' in vars(mammoth)\n"
+        "assert mammoth.JobSchema is mammoth.models.JobSchema\n"
+    )
+
+
+def test_unknown_name_raises_attribute_error():
+    import mammoth
+
+    with pytest.raises(AttributeError):
+        mammoth.does_not_exist
@@ -0,0 +1,138 @@
+"""
+Tests for the streaming multipart/form-data encoder.
+"""
+
+import io
+from email.parser import BytesParser
+from email.policy import HTTP
+
+import pytest
+import requests
+
+from mammoth.api._multipart import MultipartStream, _BLOCK_SIZE
+
+
+def _parse(content_type: str, body: bytes):
+    """Parse a multipart body into its (field name, filename, content type, data) parts."""
+    message = BytesParser(policy=HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + body
+    )
+    assert message.is_multipart()
+    return [
+        (
+            part.get_param("name", header="content-disposition"),
+            part.get_filename(),
+            part.get_content_type(),
+            part.get_payload(decode=True),
+        )
+        for part in message.iter_parts()
+    ]
+
+
+def test_body_parses_as_multipart_form_data(tmp_path):
+    csv_path = tmp_path / "sales.csv"
+    csv_path.write_bytes(b"region,total\nnorth,10\n")
+    with open(csv_path, "rb") as csv_file:
+        stream = MultipartStream([
+            ("files", "sales.csv", csv_file, "text/csv"),
+            ("files", "blob.bin", io.BytesIO(b"\x00\x01\r\n--x"), "application/octet-stream"),
+        ])
+        body = b"".join(stream)
+
+    assert stream.content_type == f"multipart/form-data; boundary={stream.boundary}"
+    assert len(body) == len(stream)
+    assert body.startswith(f"--{stream.boundary}\r\n".encode())
+    assert body.endswith(f"--{stream.boundary}--\r\n".encode())
+    assert _parse(stream.content_type, body) == [
+        ("files", "sales.csv", "text/csv", b"region,total\nnorth,10\n"),
+        ("files", "blob.bin", "application/octet-stream", b"\x00\x01\r\n--x"),
+    ]
+
+
+def test_body_starts_at_current_position_and_handles_empty_files():
+    partly_read = io.BytesIO(b"headerrows")
+    partly_read.read(6)
+    stream = MultipartStream([
+        ("files", "empty.csv", io.BytesIO(b""), "text/csv"),
+        ("files", "rows.csv", partly_read, "text/csv"),
+    ])
+    body = b"".join(stream)
+
+    assert len(body) == len(stream)
+    assert [part[3] for part in _parse(stream.content_type, body)] == [b"", b"rows"]
+
+
+def test_large_file_is_streamed_in_blocks():
+    data = bytes(range(256)) * (3 * _BLOCK_SIZE // 256 + 1)
+    stream = MultipartStream([("files", "big.bin", io.BytesIO(data), "application/octet-stream")])
+
+    blocks = list(stream)
+    assert max(len(block) for block in blocks) == _BLOCK_SIZE
+    assert len(blocks) > 3
+    assert _parse(stream.content_type, b"".join(blocks))[0][3] == data
+
+
+def test_seek_rewinds_for_a_second_pass():
+    stream = MultipartStream([("files", "a.csv", io.BytesIO(b"abc"), "text/csv")])
+    first = b"".join(stream)
+    assert stream.tell() == len(first)
+
+    assert stream.seek(0) == 0
+    assert b"".join(stream) == first
+    with pytest.raises(io.UnsupportedOperation):
+        stream.seek(3)
+
+
+def test_truncated_file_raises():
+    source = io.BytesIO(b"abcdef")
+    stream = MultipartStream([("files", "a.csv", source, "text/csv")])
+    source.truncate(2)
+    with pytest.raises(IOError):
+        b"".join(stream)
+
+
+def test_from_parts_declines_unsized_and_text_streams(tmp_path):
+    class Unsized(io.RawIOBase):
+        def readable(self):
+            return True
+
+        def seekable(self):
+            return False
+
+    text_path = tmp_path / "t.csv"
+    text_path.write_text("a\n")
+    with open(text_path) as text_file:
+        assert MultipartStream.from_parts([("files", "t.csv", text_file, "text/csv")]) is None
+    assert MultipartStream.from_parts([("files", "u.csv", Unsized(), "text/csv")]) is None
+
+
+def test_upload_sends_sized_body_and_resends_it_on_retry(make_client, tmp_path):
+    attempts = []
+
+    def handler(request, body):
+        attempts.append(body)
+        if len(attempts) == 1:
+            raise requests.exceptions.ConnectionError("connection reset")
+        return 200, [{"job_id": 1}, {"job_id": 2}], {}
+
+    client = make_client(handler)
+    first = tmp_path / "first.csv"
+    first.write_bytes(b"a\n" * (_BLOCK_SIZE // 2 + 1))
+    second = tmp_path / "second.csv"
+    second.write_bytes(b"b,c\n1,2\n")
+
+    job_ids = client.files.upload_files(1, 2, [first, second], wait_for_completion=False)
+
+    assert job_ids == [1, 2]
+    assert len(attempts) == 2
+    assert attempts[1] == attempts[0]
+    request, body = client.adapter.requests[-1]
+    assert request.headers["Content-Length"] == str(len(body))
+    assert "Transfer-Encoding" not in request.headers
+    parts = _parse(request.headers["Content-Type"], body)
+    assert [(name, filename) for name, filename, _, _ in parts] == [
+        ("files", "first.csv"),
+        ("files", "second.csv"),
+    ]
+    assert parts[0][3] == first.read_bytes()
+    assert parts[1][3] == second.read_bytes()